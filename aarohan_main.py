@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 from manim import *
@@ -7,6 +9,28 @@ from cryptologySlide import *
 from utils import *
 from piryamid import *
 
+from chord_diagram import ChordDiagram, chord_geometry
+from detail import DetailController, set_antialias
+from dot_cloud import DotCloud
+from ec_curve import RealCurve
+from ec_group import ECGroup
+from ecdlp_solver import load as load_bench
+from keyframes import KeyframeTable
+from parametric_figure import ParametricFigure, Rebuilt
+from primes import prime_mask
+from raster_figure import RasterFigure, paint_chords, paint_dots
+from scalar_mult import bit_steps, compare, sample_scalar
+from ulam import ulam_coords
+
+import frame_hold
+import gradient
+import loop_cache
+import render_profile
+import tex_cache
+tex_cache.install()      # shared, lock-safe LaTeX → SVG cache (see tex_cache.py)
+frame_hold.install()     # rasterise/encode unchanged frames once (see frame_hold.py)
+render_profile.install() # per-play() profiler, only if $AAROHAN_PROFILE is set
+
 # ═══════════════════════════════════════════════════════════════
 #  UNIFIED PALETTE  — gold / dark theme used across all slides
 # ═══════════════════════════════════════════════════════════════
@@ -60,32 +84,34 @@ class Title(Slide):
         banner.shift(UP * 2)
         
         self.next_slide(loop=True)
-        # Main title
-        main_title = Tex("Modern Cryptography, ECDLP \& Quantum Computers", font_size=FS_TITLE, color=C_GOLD_BRIGHT)
-        main_title.move_to(banner.get_center() + UP * 0.2)
-        # self.play(FadeIn(banner))
-        self.play(FadeIn(banner), Write(main_title), run_time=3)
-        # self.next_slide()
+        # The build-up replays from black by design, so the loop isn't seamless.
+        with loop_cache.segment(self, "title", seamless=False):
+            # Main title
+            main_title = Tex("Modern Cryptography, ECDLP \& Quantum Computers", font_size=FS_TITLE, color=C_GOLD_BRIGHT)
+            main_title.move_to(banner.get_center() + UP * 0.2)
+            # self.play(FadeIn(banner))
+            self.play(FadeIn(banner), Write(main_title), run_time=3)
+            # self.next_slide()
         
-        # Lecture subtitle
-        subTitle = Tex("Present and future", font_size=FS_LABEL, color=WHITE_T)
-        subTitle.next_to(main_title, DOWN, buff=0.3)
-        self.play(FadeIn(subTitle))
+            # Lecture subtitle
+            subTitle = Tex("Present and future", font_size=FS_LABEL, color=WHITE_T)
+            subTitle.next_to(main_title, DOWN, buff=0.3)
+            self.play(FadeIn(subTitle))
         
-        # Author name
-        author = Text("Dr. Abdullah Ansari", font_size=FS_SUBTITLE+4, color=C_WHITE)
-        author.next_to(banner, DOWN, buff=0.7)
-        self.play(Write(author))
-
-        # Department info
-        dept1 = Tex(
-            "Aarohan 2026 - DES PU",
-            font_size=FS_SMALL+26,
-            color=C_GOLD
-        )
-        dept1.next_to(author, DOWN, buff=0.5)
-        self.play(Write(dept1), run_time = 5)
-        self.wait(2)
+            # Author name
+            author = Text("Dr. Abdullah Ansari", font_size=FS_SUBTITLE+4, color=C_WHITE)
+            author.next_to(banner, DOWN, buff=0.7)
+            self.play(Write(author))
+
+            # Department info
+            dept1 = Tex(
+                "Aarohan 2026 - DES PU",
+                font_size=FS_SMALL+26,
+                color=C_GOLD
+            )
+            dept1.next_to(author, DOWN, buff=0.5)
+            self.play(Write(dept1), run_time = 5)
+            self.wait(2)
         self.next_slide()
         
         university = Tex(
@@ -1333,11 +1359,11 @@ class ECDLP(Slide):
         ).add_coordinates().to_edge(LEFT)
 
         self.play(DrawBorderThenFill(plane))
-        ellipticCurvePoints = getEC_points()
+        curve = RealCurve(-3, 3, y_max=13)      # sampled exactly, up to the plane's edge
+        E     = ECGroup(-3, 3)
 
         graph = VMobject(color=C_RED)
-        graph.set_points_smoothly(plane.coords_to_point(
-            ellipticCurvePoints))
+        graph.set_points_as_corners(plane.coords_to_point(curve.points))
 
         self.play(Create(graph), run_time=2.5)
         self.next_slide()
@@ -1352,12 +1378,17 @@ class ECDLP(Slide):
 
         Text_pointAdd = Tex("Point addition", color=C_BLUE).next_to(equation2, DOWN, buff=0.5).shift(LEFT).scale(0.9)
 
+        # Exact points: R' is where the line PQ meets the curve again.
+        p_xy  = tuple(curve.point_at_x(-2.0, upper=False))
+        q_xy  = tuple(curve.point_at_x(0.0))
+        r_xy  = E.chord(p_xy, q_xy)
+
         P = Dot(color=WHITE)
-        P.move_to(graph.point_from_proportion(0.50))
+        P.move_to(plane.c2p(*p_xy))
         P_label = Tex("P", font_size=FS_SMALL).next_to(P, DL)
 
         Q = Dot(color=WHITE)
-        Q.move_to(graph.point_from_proportion(0.45))
+        Q.move_to(plane.c2p(*q_xy))
         Q_label = Tex("Q", font_size=FS_TINY+2).next_to(Q, LEFT)
 
         self.play(Create(P), Write(P_label), Create(Q), Write(Q_label))
@@ -1390,7 +1421,7 @@ class ECDLP(Slide):
         self.next_slide()
 
         R = Dot(color=WHITE)
-        R.move_to(graph.point_from_proportion(0.25))
+        R.move_to(plane.c2p(*r_xy))
         R_label = Text("R'", font_size=FS_TINY+2).next_to(R, LEFT)
 
         l2 = Line(Q, R, color=C_GREEN, stroke_width=3)
@@ -1398,7 +1429,7 @@ class ECDLP(Slide):
         self.next_slide()
 
         Q2 = Dot(color=WHITE)
-        Q2.move_to(graph.point_from_proportion(0.75))
+        Q2.move_to(plane.c2p(*E.add(p_xy, q_xy)))
 
         l3 = Line(R, Q2, color=C_GREEN, stroke_width=3)
 
@@ -1424,27 +1455,36 @@ class ECDLP(Slide):
         self.play(Write(Text_pointDouble))
         self.next_slide()
 
+        # Tangent at P meets the curve again at −2P; the line through P and
+        # 2P meets it again at −3P.
+        p_xy   = tuple(curve.point_at_x(-1.5))
+        q_xy   = E.chord(p_xy, p_xy)
+        d1_xy  = E.chord(p_xy, E.double(p_xy))
+
         P = Dot(color=WHITE)
-        P.move_to(graph.point_from_proportion(0.47))
+        P.move_to(plane.c2p(*p_xy))
         P_label = Text("P", font_size=FS_TINY+2).next_to(P, UL)
 
         self.play(Create(P), Create(P_label))
         self.next_slide()
 
-        tangentToCurve = TangentLine(graph, alpha=0.47, length=8, color=C_BLUE)
+        tangent_dir = plane.c2p(p_xy[0] + 1, p_xy[1] + curve.slope(p_xy)) - plane.c2p(*p_xy)
+        tangent_dir = tangent_dir / np.linalg.norm(tangent_dir) * 4
+        tangentToCurve = Line(P.get_center() - tangent_dir, P.get_center() + tangent_dir,
+                              color=C_BLUE)
 
         self.play(Create(tangentToCurve))
         self.next_slide()
 
         Q = Dot(color=WHITE)
-        Q.move_to(graph.point_from_proportion(0.29))
+        Q.move_to(plane.c2p(*q_xy))
         Q_label = Text("Q", font_size=FS_TINY+2).next_to(Q, UL)
 
         self.play(Create(Q), Create(Q_label))
         self.next_slide()
 
         R = Dot(color=WHITE)
-        R.move_to(graph.point_from_proportion(0.71))
+        R.move_to(plane.c2p(*E.double(p_xy)))
         R_label = Tex(r"$2P = P+P$").next_to(R,
                                              RIGHT).scale(.6).shift(LEFT*0.7)
         l3 = Line(Q, R, color=C_BLUE, stroke_width=3)
@@ -1467,12 +1507,12 @@ class ECDLP(Slide):
         self.next_slide()
 
         d1 = Dot(color=WHITE)
-        d1.move_to(graph.point_from_proportion(0.567))
+        d1.move_to(plane.c2p(*d1_xy))
         self.play(Create(d1))
         self.next_slide()
 
         d2 = Dot(color=WHITE)
-        d2.move_to(graph.point_from_proportion(0.4316))
+        d2.move_to(plane.c2p(*E.mul(3, p_xy)))
         l5 = Line(d1, d2, color=C_BLUE, stroke_width=3)
         self.play(Uncreate(l4))
         self.play(Create(d2), Create(l5))
@@ -1520,6 +1560,11 @@ class ECDLP(Slide):
 
 # Aim : Double and add algorithm for scalar multiplication, complexity of ECDLP
 class DoubleAndAdd(Slide):
+    # The worked example; any positive integer works (AAROHAN_SCALAR=13 …).
+    SCALAR     = int(os.environ.get("AAROHAN_SCALAR", 9))
+    CHART_SEED = 2024       # the 256-bit scalar of the operation-count chart
+    PANEL_MAX  = 3.0        # the curve panel shows |x|, |y| ≤ PANEL_MAX
+
     def construct(self):
         self.camera.background_color = SLIDE_BG
 
@@ -1557,44 +1602,65 @@ class DoubleAndAdd(Slide):
         self.play(FadeIn(m_bin2, shift=RIGHT), run_time=1.3)
         self.next_slide()
 
-        example1 = Tex(r'e.g: $m = (9)_{10} = $').next_to(
+        bits = bit_steps(self.SCALAR)
+        example1 = Tex(rf'e.g: $m = ({self.SCALAR})_{{10}} = $').next_to(
             m_bin, DOWN, buff=0.4).shift(RIGHT*1.5)
-        example2 = Tex(r'$(1001)_2$').next_to(example1, RIGHT)
+        example2 = Tex(rf'$({"".join(str(b) for b, _ in bits)})_2$').next_to(example1, RIGHT)
 
         self.play(FadeIn(example1), FadeIn(example2))
         example2Copy = example2.copy()
         self.play(FadeIn(example2Copy))
         self.next_slide()
 
-        first_One = Tex(r'$1$').next_to(example1, DOWN).shift(LEFT*1.5)
-        first_Zero = Tex(r'$0$').next_to(first_One, DOWN)
-        seond_Zero = Tex(r'$0$').next_to(first_Zero, DOWN)
-        second_One = Tex(r'$1$').next_to(seond_Zero, DOWN)
-
-        grp = VGroup()
-        grp.add(first_Zero, first_One, seond_Zero, second_One)
+        grp = VGroup(*[Tex(f'${b}$') for b, _ in bits]).arrange(DOWN)
+        grp.next_to(example1, DOWN).shift(LEFT*1.5)
+        room = grp.get_top()[1] + config.frame_height / 2 - 0.3
+        if grp.height > room:                   # long scalars: shrink the column to fit
+            grp.scale(room / grp.height, about_edge=UP)
 
         trans = Transform(example2, grp)
         self.play(trans)
         self.next_slide()
 
-        txt_firstOne = Tex(
-            r'$\blacktriangleright$ DOUBLE and ADD', color=C_BLUE).next_to(first_One, RIGHT).scale(0.7).shift(LEFT*0.8)
-        txt_secondOne = Tex(
-            r'$\blacktriangleright$ DOUBLE and ADD', color=C_BLUE).next_to(second_One, RIGHT).scale(0.7).shift(LEFT*0.8)
-
-        txt_firstZero = Tex(
-            r'$\blacktriangleright$ DOUBLE', color=C_RED).next_to(first_Zero, RIGHT).scale(0.7).shift(LEFT*0.32)
-        txt_secondZero = Tex(
-            r'$\blacktriangleright$ DOUBLE', color=C_RED).next_to(seond_Zero, RIGHT).scale(0.7).shift(LEFT*0.35)
-
-        self.play(FadeIn(txt_firstOne, shift=RIGHT), run_time=1)
-        self.wait(1)
-        self.play(FadeIn(txt_firstZero, shift=RIGHT), run_time=1)
-        self.play(FadeIn(txt_secondZero, shift=RIGHT), run_time=1)
-        self.play(FadeIn(txt_secondOne, shift=RIGHT), run_time=1)
+        # The same steps on the real curve, drawn from the group law (ec_group.py),
+        # as long as every point of the construction fits in the panel.
+        E     = ECGroup(-3, 3)
+        curve = RealCurve(-3, 3, x_max=self.PANEL_MAX, y_max=self.PANEL_MAX)
+        P_xy  = tuple(curve.point_at_x(0.6))
+        ops   = self._curve_ops(E, P_xy, bits)
+        panel = VGroup()
+        if ops is not None:
+            r = self.PANEL_MAX
+            plane = NumberPlane(x_range=[-r, r, 1], x_length=4.5,
+                                y_range=[-r, r, 1], y_length=4.5,
+                                background_line_style={
+                "stroke_color": BLUE,
+                "stroke_width": 1,
+                "stroke_opacity": 0.3
+            }
+            ).to_edge(RIGHT, buff=0.8).shift(DOWN*0.5)
+            graph = VMobject(color=C_RED, stroke_width=2)
+            graph.set_points_as_corners(plane.coords_to_point(curve.points))
+            self.play(FadeIn(plane), Create(graph), run_time=1.5)
+            panel.add(plane, graph)
+
+        for i, ((b, step), bit) in enumerate(zip(bits, grp)):
+            txt = Tex(rf'$\blacktriangleright$ {step}', color=C_BLUE if b else C_RED)
+            txt.scale(0.7 * grp[0].height / Tex('$1$').height).next_to(bit, RIGHT, buff=0.15)
+            self.play(FadeIn(txt, shift=RIGHT), run_time=1)
+            if ops is None:
+                continue
+            for R_xy, Q_xy, name in ops[i]:
+                if R_xy is None:
+                    panel.add(self._curve_point(plane, Q_xy, name))
+                else:
+                    self._curve_step(plane, E, panel, R_xy, Q_xy, name)
+            if i == 0:
+                self.wait(1)
 
         self.next_slide()
+        if ops is not None:
+            self.play(FadeOut(panel))
 
         complexity = Tex(r"Complexity",
                          font_size=40, color=C_BLUE).shift(RIGHT*3).shift(UP)
@@ -1611,9 +1677,91 @@ class DoubleAndAdd(Slide):
         self.play(Create(myRect), run_time=2)
         self.wait(0.3)
         self.play(FadeOut(myRect))
+        self.next_slide()
+
+        self.play(*[FadeOut(mob) for mob in self.mobjects])
+        self._ops_chart()
 
         # nextScenePause(self)
 
+    def _curve_ops(self, E, P_xy, bits):
+        """
+        Per bit, the (R, Q, name) steps of double-and-add on the real curve
+        (R None: just place Q), or None if a point leaves the panel.
+        """
+        ops, R_xy, k = [], None, 0
+        for b, _ in bits:
+            steps = []
+            if R_xy is not None:
+                steps.append((R_xy, R_xy, f"{2 * k}P"))
+                R_xy, k = E.double(R_xy), 2 * k
+            if b:
+                steps.append((R_xy, P_xy, "P" if k == 0 else f"{k + 1}P"))
+                R_xy, k = (P_xy if R_xy is None else E.add(R_xy, P_xy)), k + 1
+            ops.append(steps)
+        for R, Q, _ in (s for steps in ops for s in steps):
+            for pt in ([Q] if R is None else [R, Q, E.chord(R, Q)]):
+                if pt is None or max(abs(pt[0]), abs(pt[1])) > self.PANEL_MAX:
+                    return None
+        return ops
+
+    def _ops_chart(self):
+        """Doublings and additions per algorithm for a fixed 256-bit m (scalar_mult.py)."""
+        rows  = compare(sample_scalar(self.CHART_SEED), repeat=0)
+        naive = rows[0]
+        rows  = rows[1:]
+        top   = max(r["doubles"] + r["adds"] for r in rows)
+        unit  = 4.0 / top                       # scene units per operation
+
+        title = Tex(r"Computing $mP$ for a 256-bit $m$ (P-256)",
+                    font_size=FS_SUBTITLE, color=C_BLUE).to_edge(UP)
+        bars  = VGroup()
+        for i, r in enumerate(rows):
+            dbl = Rectangle(width=1.2, height=r["doubles"] * unit, stroke_width=0,
+                            fill_color=C_BLUE, fill_opacity=0.85)
+            add = Rectangle(width=1.2, height=max(r["adds"] * unit, 1e-3), stroke_width=0,
+                            fill_color=C_RED, fill_opacity=0.85)
+            add.next_to(dbl, UP, buff=0)
+            total = Tex(f"{r['doubles'] + r['adds']}", font_size=FS_SMALL).next_to(add, UP, buff=0.1)
+            name  = Tex(r["name"], font_size=FS_SMALL).next_to(dbl, DOWN, buff=0.2)
+            bar = VGroup(dbl, add, total, name)
+            bar.shift(RIGHT * (2.6 * i) - dbl.get_bottom())
+            bars.add(bar)
+        bars.move_to(DOWN * 0.4)
+
+        legend = VGroup(
+            Tex(r"$\blacksquare$ doublings", font_size=FS_SMALL, color=C_BLUE),
+            Tex(r"$\blacksquare$ additions", font_size=FS_SMALL, color=C_RED),
+        ).arrange(RIGHT, buff=0.6).next_to(title, DOWN, buff=0.3)
+        note = Tex(rf"naive $P+P+\dots+P$: $\approx 2^{{{naive['adds'].bit_length()}}}$ additions",
+                   font_size=FS_LABEL, color=C_GOLD_BRIGHT).to_edge(DOWN)
+
+        self.play(Write(title), FadeIn(legend))
+        self.play(LaggedStart(*[GrowFromEdge(b[:2], DOWN) for b in bars], lag_ratio=0.2))
+        self.play(*[FadeIn(b[2:]) for b in bars])
+        self.next_slide()
+        self.play(Write(note))
+
+    def _curve_point(self, plane, xy, name):
+        dot = Dot(plane.c2p(*xy), color=WHITE, radius=0.06)
+        lbl = Tex(f"${name}$", font_size=FS_TINY).next_to(dot, UR, buff=0.05)
+        self.play(FadeIn(dot), Write(lbl), run_time=0.6)
+        return VGroup(dot, lbl)
+
+    def _curve_step(self, plane, E, panel, R_xy, Q_xy, name):
+        """Animate R + Q (a doubling when Q is R): line to the third point, then its mirror."""
+        third = E.chord(R_xy, Q_xy)
+        total = E.neg(third)
+        ends  = sorted([R_xy, Q_xy, third])           # the line spans all three points
+        line  = Line(plane.c2p(*ends[0]), plane.c2p(*ends[-1]),
+                     color=C_BLUE if R_xy == Q_xy else C_GREEN, stroke_width=2)
+        drop  = DashedLine(plane.c2p(*third), plane.c2p(*total), color=C_GREY, stroke_width=2)
+        self.play(Create(line), run_time=0.8)
+        self.play(Create(drop), run_time=0.5)
+        panel.add(self._curve_point(plane, total, name))
+        self.play(FadeOut(line), FadeOut(drop), run_time=0.4)
+        return total
+
 # Aim : Show ECDLP, inverse problem is hard
 class ECDLP2(Slide):
     def construct(self):
@@ -1651,9 +1799,83 @@ class ECDLP2(Slide):
 
         self.play(txt_4.animate.shift(UP),
                   txt_51.animate.shift(UP), run_time=3)
+        self.next_slide()
+
+        # Over F_p the same curve is a scatter with no visible structure.
+        self.play(FadeOut(txt_1), FadeOut(txt_4), FadeOut(txt_51))
+        fp_small = fp_point_cloud(-3, 3, 101, size=5.0).shift(LEFT*3.3 + DOWN*0.4)
+        fp_large = fp_point_cloud(-3, 3, 1_000_003, size=5.0).shift(RIGHT*3.3 + DOWN*0.4)
+        lbl_small = Tex(r'$y^2 = x^3 - 3x + 3 \pmod{101}$',
+                        font_size=FS_LABEL).next_to(fp_small, UP)
+        lbl_large = Tex(r'$y^2 = x^3 - 3x + 3 \pmod{1\,000\,003}$',
+                        font_size=FS_LABEL).next_to(fp_large, UP)
+        self.play(FadeIn(fp_small), Write(lbl_small))
+        self.next_slide()
+
+        self.play(FadeIn(fp_large), Write(lbl_large))
+        self.next_slide()
+
+        self.play(FadeOut(fp_small), FadeOut(lbl_small), FadeOut(fp_large), FadeOut(lbl_large))
+        self._attack_growth()
 
         # nextScenePause(self)
 
+    def _attack_growth(self):
+        """Measured time to solve the ECDLP against the subgroup size (ecdlp_solver.py)."""
+        data = load_bench()                      # ecdlp_bench.json, measured offline
+        rows = data["results"]
+        bits = [r["bits"] for r in rows]
+        logt = [np.log10(r["seconds"]) for r in rows]
+
+        # √n growth: log10(t) = bits · log10(2) / 2 + c, fitted to the rho times.
+        half = np.log10(2) / 2
+        rho  = [(b, t) for b, t, r in zip(bits, logt, rows) if r["method"] == "rho"]
+        fit  = [t - b * half for b, t in rho if t > -1] or [t - b * half for b, t in rho]
+        c    = float(np.median(fit))
+
+        ends   = [min(bits) * half + c, max(bits) * half + c]
+        lo, hi = int(np.floor(min(logt + ends))), int(np.ceil(max(logt + ends)))
+        axes = Axes(x_range=[min(bits) - 2, max(bits) + 2, 4], y_range=[lo, hi, 1],
+                    x_length=9, y_length=4.5, tips=False,
+                    axis_config={"color": C_GREY}).shift(DOWN*0.3)
+        axes.x_axis.add_numbers(range(min(bits), max(bits) + 1, 4), font_size=FS_TINY + 4)
+        y_nums = VGroup(*[
+            MathTex(f"10^{{{k}}}", font_size=FS_TINY + 4).next_to(axes.c2p(min(bits) - 2, k), LEFT)
+            for k in range(lo, hi + 1)
+        ])
+        x_lbl = Tex(r"subgroup size $n$ (bits)", font_size=FS_SMALL).next_to(axes.x_axis, DOWN, buff=0.5)
+        y_lbl = Tex(r"seconds", font_size=FS_SMALL).next_to(axes.y_axis, UP)
+        title = Tex(r"Time to find $m$, measured",
+                    font_size=FS_SUBTITLE, color=C_BLUE).to_edge(UP)
+        cpu    = "".join("\\" + ch if ch in "_%&#$" else ch for ch in data["cpu"])
+        source = Tex(rf"{cpu}, {data['jobs']} $\rho$ workers, {data['date'][:10]}",
+                     font_size=FS_TINY + 4, color=C_GREY).next_to(title, DOWN, buff=0.15)
+
+        curve = DashedVMobject(axes.plot(lambda b: b * half + c,
+                                         x_range=[min(bits), max(bits)]), num_dashes=40)
+        curve.set_color(C_GREY)
+        dots = VGroup(*[
+            Dot(axes.c2p(b, t), radius=0.07, color=C_GREEN if r["method"] == "rho" else C_BLUE)
+            for b, t, r in zip(bits, logt, rows)
+        ])
+        legend = VGroup(
+            Tex(r"$\bullet$ baby-step giant-step", font_size=FS_SMALL, color=C_BLUE),
+            Tex(r"$\bullet$ Pollard $\rho$", font_size=FS_SMALL, color=C_GREEN),
+            Tex(r"-\,-\, $\propto \sqrt{n}$", font_size=FS_SMALL, color=C_GREY),
+        ).arrange(DOWN, aligned_edge=LEFT).next_to(axes.c2p(min(bits), hi), DR, buff=0.2)
+
+        self.play(Write(title), FadeIn(source), Create(axes), FadeIn(y_nums), FadeIn(x_lbl),
+                  FadeIn(y_lbl))
+        self.play(LaggedStart(*[FadeIn(d, scale=0.5) for d in dots], lag_ratio=0.1),
+                  FadeIn(legend))
+        self.play(Create(curve), run_time=1.5)
+        self.next_slide()
+
+        years = 10 ** (128 * np.log10(2) + c) / 3.156e7          # 256-bit n: √n = 2¹²⁸
+        note  = Tex(rf"256-bit curve: $\sim 10^{{{int(np.log10(years))}}}$ years",
+                    font_size=FS_BODY, color=C_GOLD_BRIGHT).next_to(axes, DOWN, buff=0.9)
+        self.play(Write(note))
+
 # Aim : Triangle stack w.r.t. ECDLP
 class ECDLP3(Slide):
     def construct(self):
@@ -2164,19 +2386,27 @@ class QuantumThreat(Slide, MovingCameraScene):
         "DARK_PANEL": "#111111",
     }
 
+    # Sub-slides in presentation order. Each one starts from an empty scene
+    # (the previous one ends with _clear_slide()), so segment_render.py can
+    # render them in separate processes and stitch the results.
+    SEGMENTS = [
+        "_slide_00_qc_intro",
+        "_slide_01_exp_vs_poly",
+        "_slide_02_key_table",
+        # "_slide_03_aes_doubling",
+        # "_slide_04_cost_of_fix",
+        "_slide_05_hndl_timeline",
+        "_slide_06_shelf_life",
+        # "_slide_07_breach",
+        "_slide_08_pqc_table",
+    ]
+
     def construct(self):
         self.camera.background_color = self.COLORS["BG"]
         self.camera.frame.save_state()
 
-        self._slide_00_qc_intro()
-        self._slide_01_exp_vs_poly()
-        self._slide_02_key_table()
-        # self._slide_03_aes_doubling()
-        # self._slide_04_cost_of_fix()
-        self._slide_05_hndl_timeline()
-        self._slide_06_shelf_life()
-        # self._slide_07_breach()
-        self._slide_08_pqc_table()
+        for name in self.SEGMENTS:
+            getattr(self, name)()
 
     # ─────────────────────────────────────────────────────────
     #  Helpers
@@ -3238,6 +3468,19 @@ class LastSlide(Slide, MovingCameraScene):
     ULAM_SCALE = 0.32
     ULAM_DOT_R = 0.055
 
+    # Chord / Ulam figures with more elements than this are painted into a
+    # single image (raster_figure.py) instead of one path per element.
+    RASTER_ABOVE = 5000
+
+    # ─────────────────────────────────────────────────────────
+    #  DETAIL  (detail.py)
+    # ─────────────────────────────────────────────────────────
+    # Per-frame render budget in ms; None always draws full detail.
+    # Set AAROHAN_FRAME_BUDGET_MS for predictable -qk / 60 fps renders.
+    FRAME_BUDGET_MS = (float(os.environ["AAROHAN_FRAME_BUDGET_MS"])
+                       if os.environ.get("AAROHAN_FRAME_BUDGET_MS") else None)
+    MIN_LINES       = 90     # minimum visual density: never fewer chords
+
     # ── Loop start / end tracker state ────────────────────────
     # The loop restarts from WAYPOINTS_NORMAL[0].
     # At the end of Phase 4 we reset all trackers to exactly
@@ -3245,36 +3488,10 @@ class LastSlide(Slide, MovingCameraScene):
     LOOP_START_N = float(WAYPOINTS_NORMAL[0][0])   # 200.0
     LOOP_START_M = float(WAYPOINTS_NORMAL[0][1])   # 2.0
 
-    @staticmethod
-    def _sieve(n):
-        """Generate set of primes up to n using Sieve of Eratosthenes."""
-        is_p = [True] * (n + 1)
-        is_p[0] = is_p[1] = False
-        for i in range(2, int(n**0.5) + 1):
-            if is_p[i]:
-                for j in range(i * i, n + 1, i):
-                    is_p[j] = False
-        return set(i for i, v in enumerate(is_p) if v)
-
-    @staticmethod
-    def _ulam_xy(n):
-        """Map integer n to (col, row) in the Ulam square spiral."""
-        if n == 1:
-            return (0, 0)
-        x = y = 0
-        dx, dy = 0, -1
-        i = 1
-        while i < n:
-            if x == y or (x < 0 and x == -y) or (x > 0 and x == 1 - y):
-                dx, dy = -dy, dx
-            x += dx
-            y += dy
-            i += 1
-        return (x, y)
-
     def construct(self):
-        # Generate primes set for this instance
-        PRIMES = self._sieve(500)
+        # Boolean prime mask (primes.py) covering every k the figures index
+        PRIMES = prime_mask(max(self.ULAM_N,
+                                *(n for n, _ in self.WAYPOINTS_NORMAL + self.WAYPOINTS_PRIME)))
         
         self.camera.background_color = self.BG
         self.camera.frame.save_state()
@@ -3288,32 +3505,29 @@ class LastSlide(Slide, MovingCameraScene):
         M_t     = ValueTracker(self.LOOP_START_M)
         prime_t = ValueTracker(0.0)   # 0=all lines, 1=prime-only
 
-        # ── always_redraw mobjects ────────────────────────────
-        lines_mob = always_redraw(lambda: self._lines(
-            int(round(N_t.get_value())),
-            M_t.get_value(),
-            prime_t.get_value(),
-            PRIMES,
-        ))
-        dots_mob = always_redraw(lambda: self._dots(
-            int(round(N_t.get_value())),
-            PRIMES,
-        ))
-        math_lbl = always_redraw(lambda: self._math_label(
-            int(round(N_t.get_value())),
-            M_t.get_value(),
-            prime_t.get_value(),
-        ))
+        # ── Level of detail, bounded by FRAME_BUDGET_MS ───────
+        self.detail  = DetailController(self.FRAME_BUDGET_MS, self.NUM_LINES,
+                                        self.MIN_LINES, config.pixel_width, name="LastSlide")
+        self._detail = self.detail.detail()
+
+        # ── Tracker-driven figure, updated in place ───────────
+        # One updater reads the trackers once per frame; the chords rewrite
+        # their buffers, dots and label are rebuilt only when N / text change.
+        lines_mob = self._lines(int(self.LOOP_START_N), self.LOOP_START_M, 0.0, PRIMES)
+        dots_mob  = Rebuilt(lambda N, M, ps, d: self._dots(N, PRIMES, d.dot_fraction),
+                            key=lambda N, M, ps, d: (N, d.dot_fraction))
+        math_lbl  = Rebuilt(lambda N, M, ps, d: self._math_label(N, M, ps),
+                            key=lambda N, M, ps, d: self._math_text(N, M, ps))
+        figure    = ParametricFigure(
+            lambda: (int(round(N_t.get_value())), M_t.get_value(), prime_t.get_value(),
+                     self._detail),
+            lines_mob, dots_mob, math_lbl,
+        )
 
         # ════════════════════════════════════════════════════
         #  SLIDE 0 — INTRO  (one-shot fade-in, non-looping)
         # ════════════════════════════════════════════════════
-        self.play(
-            FadeIn(lines_mob, run_time=2.0),
-            FadeIn(dots_mob,  run_time=2.0),
-            FadeIn(math_lbl,  run_time=2.0),
-            run_time=2.0,
-        )
+        self.play(FadeIn(figure, run_time=2.0), run_time=2.0)
         self.wait(0.5)
 
         # ── Press → to enter the loop ────────────────────────
@@ -3326,102 +3540,108 @@ class LastSlide(Slide, MovingCameraScene):
         # ════════════════════════════════════════════════════
         self.next_slide(loop=True)
 
-        # ── Phase 1: Normal spiral ────────────────────────────
-        for i in range(1, len(self.WAYPOINTS_NORMAL)):
-            n_tgt, m_tgt = self.WAYPOINTS_NORMAL[i]
-            # Alternate zoom: in on even indices, out on odd
-            zoom_w = self.BASE_W * (1.0 - (1 if i % 2 == 0 else -1) * self.ZOOM_AMT)
+        # Rendered once per code/constants/quality; reused from .loop_cache/
+        with loop_cache.segment(self, "loop"):
+            # ── Phase 1: Normal spiral ────────────────────────────
+            for i in range(1, len(self.WAYPOINTS_NORMAL)):
+                n_tgt, m_tgt = self.WAYPOINTS_NORMAL[i]
+                self._apply_detail(f"normal {i}")
+                self._tabulate(lines_mob, N_t, M_t, prime_t, n_tgt, m_tgt, self.SEG_NORMAL)
+                if i == 1:
+                    loop_detail = self._detail   # the loop must end as it starts
+                # Alternate zoom: in on even indices, out on odd
+                zoom_w = self.BASE_W * (1.0 - (1 if i % 2 == 0 else -1) * self.ZOOM_AMT)
+                self.play(
+                    N_t.animate.set_value(float(n_tgt)),
+                    M_t.animate.set_value(float(m_tgt)),
+                    self.camera.frame.animate.set_width(zoom_w),
+                    run_time=self.SEG_NORMAL,
+                    rate_func=smooth,
+                )
+
+            # ── Phase 2: Prime filter fades in ───────────────────
+            self._apply_detail("prime fade-in")
             self.play(
-                N_t.animate.set_value(float(n_tgt)),
-                M_t.animate.set_value(float(m_tgt)),
-                self.camera.frame.animate.set_width(zoom_w),
-                run_time=self.SEG_NORMAL,
+                prime_t.animate.set_value(1.0),
+                self.camera.frame.animate.set_width(self.BASE_W),
+                run_time=self.CROSSFADE,
                 rate_func=smooth,
             )
 
-        # ── Phase 2: Prime filter fades in ───────────────────
-        self.play(
-            prime_t.animate.set_value(1.0),
-            self.camera.frame.animate.set_width(self.BASE_W),
-            run_time=self.CROSSFADE,
-            rate_func=smooth,
-        )
+            for i in range(1, len(self.WAYPOINTS_PRIME)):
+                n_tgt, m_tgt = self.WAYPOINTS_PRIME[i]
+                self._apply_detail(f"prime {i}")
+                self._tabulate(lines_mob, N_t, M_t, prime_t, n_tgt, m_tgt, self.SEG_PRIME)
+                zoom_w = self.BASE_W * (1.0 - (1 if i % 2 == 1 else -1) * self.ZOOM_AMT)
+                self.play(
+                    N_t.animate.set_value(float(n_tgt)),
+                    M_t.animate.set_value(float(m_tgt)),
+                    self.camera.frame.animate.set_width(zoom_w),
+                    run_time=self.SEG_PRIME,
+                    rate_func=smooth,
+                )
 
-        for i in range(1, len(self.WAYPOINTS_PRIME)):
-            n_tgt, m_tgt = self.WAYPOINTS_PRIME[i]
-            zoom_w = self.BASE_W * (1.0 - (1 if i % 2 == 1 else -1) * self.ZOOM_AMT)
+            # Restore zoom before Ulam
             self.play(
-                N_t.animate.set_value(float(n_tgt)),
-                M_t.animate.set_value(float(m_tgt)),
-                self.camera.frame.animate.set_width(zoom_w),
-                run_time=self.SEG_PRIME,
+                self.camera.frame.animate.set_width(self.BASE_W),
+                run_time=2.0,
                 rate_func=smooth,
             )
 
-        # Restore zoom before Ulam
-        self.play(
-            self.camera.frame.animate.set_width(self.BASE_W),
-            run_time=2.0,
-            rate_func=smooth,
-        )
+            # ── Phase 3: Ulam spiral ──────────────────────────────
+            ulam_grp  = self._ulam(PRIMES)
+            ulam_note = Text(
+                "Ulam Spiral  —  primes in gold",
+                font="Rajdhani", font_size=20, color=self.GOLD_MID,
+            ).to_corner(DR, buff=0.42)
 
-        # ── Phase 3: Ulam spiral ──────────────────────────────
-        ulam_grp  = self._ulam(PRIMES)
-        ulam_note = Text(
-            "Ulam Spiral  —  primes in gold",
-            font="Rajdhani", font_size=20, color=self.GOLD_MID,
-        ).to_corner(DR, buff=0.42)
+            # Circle → Ulam crossfade
+            self.play(
+                FadeOut(figure,    run_time=self.ULAM_IN),
+                FadeIn(ulam_grp,   run_time=self.ULAM_IN),
+                FadeIn(ulam_note,  run_time=self.ULAM_IN),
+                run_time=self.ULAM_IN,
+                rate_func=smooth,
+            )
 
-        # Circle → Ulam crossfade
-        self.play(
-            FadeOut(lines_mob, run_time=self.ULAM_IN),
-            FadeOut(dots_mob,  run_time=self.ULAM_IN),
-            FadeOut(math_lbl,  run_time=self.ULAM_IN),
-            FadeIn(ulam_grp,   run_time=self.ULAM_IN),
-            FadeIn(ulam_note,  run_time=self.ULAM_IN),
-            run_time=self.ULAM_IN,
-            rate_func=smooth,
-        )
+            # Breathe in then out while holding Ulam
+            half = self.ULAM_HOLD / 2
+            self.play(
+                self.camera.frame.animate.set_width(self.BASE_W * (1 - self.ZOOM_AMT)),
+                run_time=half,
+                rate_func=smooth,
+            )
+            self.play(
+                self.camera.frame.animate.set_width(self.BASE_W * (1 + self.ZOOM_AMT * 0.5)),
+                run_time=half,
+                rate_func=smooth,
+            )
 
-        # Breathe in then out while holding Ulam
-        half = self.ULAM_HOLD / 2
-        self.play(
-            self.camera.frame.animate.set_width(self.BASE_W * (1 - self.ZOOM_AMT)),
-            run_time=half,
-            rate_func=smooth,
-        )
-        self.play(
-            self.camera.frame.animate.set_width(self.BASE_W * (1 + self.ZOOM_AMT * 0.5)),
-            run_time=half,
-            rate_func=smooth,
-        )
+            # Ulam → circle crossfade
+            self.play(
+                FadeOut(ulam_grp,  run_time=self.ULAM_OUT),
+                FadeOut(ulam_note, run_time=self.ULAM_OUT),
+                FadeIn(figure,     run_time=self.ULAM_OUT),
+                self.camera.frame.animate.set_width(self.BASE_W),
+                run_time=self.ULAM_OUT,
+                rate_func=smooth,
+            )
 
-        # Ulam → circle crossfade
-        self.play(
-            FadeOut(ulam_grp,  run_time=self.ULAM_OUT),
-            FadeOut(ulam_note, run_time=self.ULAM_OUT),
-            FadeIn(lines_mob,  run_time=self.ULAM_OUT),
-            FadeIn(dots_mob,   run_time=self.ULAM_OUT),
-            FadeIn(math_lbl,   run_time=self.ULAM_OUT),
-            self.camera.frame.animate.set_width(self.BASE_W),
-            run_time=self.ULAM_OUT,
-            rate_func=smooth,
-        )
-
-        # ── Phase 4: Reset to loop-start state ───────────────
-        # This must land on exactly LOOP_START_N / LOOP_START_M
-        # so the restart of the loop is visually seamless.
-        self.play(
-            N_t.animate.set_value(self.LOOP_START_N),
-            M_t.animate.set_value(self.LOOP_START_M),
-            prime_t.animate.set_value(0.0),
-            self.camera.frame.animate.set_width(self.BASE_W),
-            run_time=self.SEG_NORMAL,
-            rate_func=smooth,
-        )
+            # ── Phase 4: Reset to loop-start state ───────────────
+            # This must land on exactly LOOP_START_N / LOOP_START_M
+            # so the restart of the loop is visually seamless.
+            self._apply_detail("reset", pin=loop_detail)
+            self.play(
+                N_t.animate.set_value(self.LOOP_START_N),
+                M_t.animate.set_value(self.LOOP_START_M),
+                prime_t.animate.set_value(0.0),
+                self.camera.frame.animate.set_width(self.BASE_W),
+                run_time=self.SEG_NORMAL,
+                rate_func=smooth,
+            )
 
-        # Brief hold so the loop-start frame is visible before replay
-        self.wait(1.2)
+            # Brief hold so the loop-start frame is visible before replay
+            self.wait(1.2)
 
         # ════════════════════════════════════════════════════
         #  SLIDE 2 — EXIT (press → to reach here and stop)
@@ -3429,9 +3649,7 @@ class LastSlide(Slide, MovingCameraScene):
         self.next_slide()
 
         self.play(
-            FadeOut(lines_mob, run_time=1.5),
-            FadeOut(dots_mob,  run_time=1.5),
-            FadeOut(math_lbl,  run_time=1.5),
+            FadeOut(figure,    run_time=1.5),
             FadeOut(q_label,   run_time=1.5),
             run_time=1.5,
         )
@@ -3445,75 +3663,70 @@ class LastSlide(Slide, MovingCameraScene):
         """
         Connection lines k → Mk mod N.
         ps (prime_strength 0→1): blends all-lines → prime-only.
+        Geometry and colours are computed in one NumPy pass (chord_diagram.py);
+        above RASTER_ABOVE chords they are painted into one image instead.
         """
-        grp  = VGroup()
-        N    = max(N, 3)
-        step = max(1, N // self.NUM_LINES)
-
-        for k in range(0, N, step):
-            k2 = int(round(M * k)) % N
-            if k2 == k:
-                continue
-
-            is_p = k in PRIMES
-            t    = k / N
-            base_col = interpolate_color(self.GOLD_DIM, self.GOLD_BRIGHT, t)
-            base_op  = 0.12 + 0.55 * abs(np.sin(PI * t))
-
-            if ps > 0.01:
-                if is_p:
-                    col = interpolate_color(base_col, self.PRIME_COLOR, ps)
-                    op  = base_op + ps * (0.85 - base_op)
-                    sw  = 0.7 + ps * 0.6
-                else:
-                    col = interpolate_color(base_col, self.COMP_COLOR, ps)
-                    op  = base_op * (1.0 - ps * 0.95)
-                    sw  = 0.7 * (1.0 - ps * 0.9)
-            else:
-                col = base_col
-                op  = base_op
-                sw  = 0.7
-
-            if op < 0.01:
-                continue
-
-            a1 = 2 * PI * k  / N - PI / 2
-            a2 = 2 * PI * k2 / N - PI / 2
-            p1 = np.array([self.RADIUS * np.cos(a1), self.RADIUS * np.sin(a1), 0])
-            p2 = np.array([self.RADIUS * np.cos(a2), self.RADIUS * np.sin(a2), 0])
-
-            grp.add(Line(p1, p2,
-                         stroke_width=sw, color=col, stroke_opacity=op))
-        return grp
+        colors = gradient.palette(self.GOLD_DIM, self.GOLD_BRIGHT, self.PRIME_COLOR, self.COMP_COLOR)
+        if self.NUM_LINES > self.RASTER_ABOVE:
+            size = 2 * self.RADIUS + 0.1
+            return RasterFigure(
+                lambda ctx, N, M, ps, d=self._detail: paint_chords(ctx, *chord_geometry(
+                    N, M, ps, PRIMES, self.RADIUS, d.lines, colors)),
+                size, size, state=(N, M, ps), camera_frame=self.camera.frame,
+            )
+        return ChordDiagram(
+            N, M, ps, PRIMES,
+            radius=self.RADIUS,
+            max_lines=self.NUM_LINES,
+            palette=colors,
+        )
 
-    def _dots(self, N, PRIMES):
-        N   = max(N, 3)
-        grp = VGroup()
-        for k in range(N):
-            ang  = 2 * PI * k / N - PI / 2
-            is_p = k in PRIMES
-            grp.add(Dot(
-                point=[self.RADIUS * np.cos(ang), self.RADIUS * np.sin(ang), 0],
-                radius=0.028 if is_p else 0.018,
-                color=self.GOLD_BRIGHT if is_p else self.GOLD_MID,
-                fill_opacity=0.75 if is_p else 0.40,
-            ))
-        return grp
+    def _dots(self, N, PRIMES, fraction=1.0):
+        """Ring of N dots; below full detail only every n-th composite is kept."""
+        N    = max(N, 3)
+        k    = np.arange(N)
+        k    = k[PRIMES[k] | (k % max(1, round(1 / fraction)) == 0)]
+        ang  = 2 * PI * k / N - PI / 2
+        is_p = PRIMES[k]
+        return DotCloud(
+            np.stack([self.RADIUS * np.cos(ang), self.RADIUS * np.sin(ang), np.zeros(len(k))],
+                     axis=1),
+            np.where(is_p, 0.028, 0.018),
+            np.where(is_p[:, None], gradient.rgba(self.GOLD_BRIGHT, 0.75),
+                     gradient.rgba(self.GOLD_MID, 0.40)),
+        )
 
     def _ulam(self, PRIMES):
-        grp = VGroup()
-        s   = self.ULAM_SCALE
-        r   = self.ULAM_DOT_R
-        for n in range(1, self.ULAM_N + 1):
-            cx, cy = self._ulam_xy(n)
-            is_p   = n in PRIMES
-            grp.add(Dot(
-                point=[cx * s, cy * s, 0],
-                radius=r if is_p else r * 0.30,
-                color=self.GOLD_BRIGHT if is_p else self.GOLD_DIM,
-                fill_opacity=0.92 if is_p else 0.18,
-            ))
-        return grp
+        s    = self.ULAM_SCALE
+        r    = self.ULAM_DOT_R
+        n    = np.arange(1, self.ULAM_N + 1)
+        xy   = ulam_coords(self.ULAM_N)          # closed form, cached per N
+        is_p = PRIMES[n]
+        dots = (
+            np.concatenate([xy * s, np.zeros((len(n), 1))], axis=1),
+            np.where(is_p, r, r * 0.30),
+            np.where(is_p[:, None], gradient.rgba(self.GOLD_BRIGHT, 0.92),
+                     gradient.rgba(self.GOLD_DIM, 0.18)),
+        )
+        if self.ULAM_N > self.RASTER_ABOVE:
+            size = 2 * (np.abs(xy).max() * s + r)
+            return RasterFigure(lambda ctx: paint_dots(ctx, *dots), size, size,
+                                camera_frame=self.camera.frame)
+        return DotCloud(*dots)
+
+    def _apply_detail(self, label, pin=None):
+        """Pick the detail level for the next segment (detail.py) and apply it."""
+        self._detail = self.detail.choose(label, pin=pin)
+        set_antialias(self.camera, self._detail.antialias)
+
+    def _tabulate(self, lines_mob, N_t, M_t, prime_t, n_tgt, m_tgt, run_time):
+        """Precompute the chords of every frame of the coming waypoint (keyframes.py)."""
+        if isinstance(lines_mob, ChordDiagram):
+            lines_mob.table = KeyframeTable.for_segment(
+                N_t.get_value(), M_t.get_value(), n_tgt, m_tgt, prime_t.get_value(),
+                run_time, config.frame_rate, smooth,
+                lines_mob.primes, lines_mob.radius, self._detail.lines, lines_mob.palette,
+            )
 
     def _q_label(self):
         lbl = Text(
@@ -3526,10 +3739,14 @@ class LastSlide(Slide, MovingCameraScene):
         lbl.set_stroke(self.GOLD_BRIGHT, width=2, opacity=0.25)
         return lbl
 
+    def _math_text(self, N, M, ps):
+        return (f"k prime  →  {int(round(M))}k mod {N}"
+                if ps > 0.5
+                else f"k  →  {int(round(M))}k mod {N}")
+
     def _math_label(self, N, M, ps):
-        s = (f"k prime  →  {int(round(M))}k mod {N}"
-             if ps > 0.5
-             else f"k  →  {int(round(M))}k mod {N}")
-        return Text(
-            s, font="Rajdhani", font_size=19, color=self.GOLD_MID,
-        ).to_corner(DR, buff=0.42)
\ No newline at end of file
+        # Rebuilt only when the text changes; only a few dozen distinct
+        # strings occur, and cached_text skips the Pango layout for repeats.
+        return cached_text(
+            self._math_text(N, M, ps), font="Rajdhani", font_size=19, color=self.GOLD_MID,
+        ).to_corner(DR, buff=0.42)
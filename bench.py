@@ -0,0 +1,219 @@
+"""
+Bench — Render Benchmarks with Stored Baselines
+===============================================
+
+Renders every Slide class (or the named ones) headless at -ql, and optionally
+-qm, one scene at a time, and records per scene:
+
+    wall_s        wall-clock render time (best of --repeat runs)
+    peak_rss_mb   peak resident memory of the manim process
+    frames        frames in the rendered movie
+    bytes         size of the rendered movie
+
+Each run happens in a scratch directory that links to the deck sources and
+images/, with caching disabled and PYTHONHASHSEED fixed, so the real media/
+and slides/ folders are left alone and every run renders from scratch.  The
+shared LaTeX cache is used as-is — run `python tex_cache.py warm` first so
+LaTeX does not dominate the first scene.
+
+Results are compared against bench_baseline.json (checked into the repo);
+scenes more than --threshold percent slower are flagged and the exit status
+is 1.  Once a baseline has been recorded, scenes it has no entry for fail
+too; until then (an empty baseline) they only print a warning.
+
+Run:
+    python bench.py                     # -ql, compare with the baseline
+    python bench.py -q l m --repeat 3   # both qualities, best of three
+    python bench.py LastSlide           # only the named scenes
+    python bench.py --update            # record a new baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from render_all import DECK_FILE, discover_scenes, manim_command
+
+
+ROOT          = Path(__file__).resolve().parent
+BASELINE_FILE = ROOT / "bench_baseline.json"
+LOG_DIR       = ROOT / "logs" / "bench"
+
+BENCH_QUALITIES = ["l", "m"]
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  MEASUREMENT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _sandbox(tmp):
+    """Scratch working directory that sees the deck through symlinks."""
+    for src in list(ROOT.glob("*.py")) + [ROOT / "images"]:
+        (tmp / src.name).symlink_to(src)
+    return tmp
+
+
+def _count_frames(movie):
+    import av
+
+    with av.open(str(movie)) as container:
+        stream = container.streams.video[0]
+        return stream.frames or sum(1 for _ in container.decode(stream))
+
+
+def run_once(scene, quality, log):
+    """One headless render in a fresh sandbox; returns a result dict or None."""
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        cwd = _sandbox(Path(tmp))
+        cmd = manim_command(scene, quality, cwd / DECK_FILE.name,
+                            extra=["--disable_caching", "--progress_bar", "none"])
+        env = dict(os.environ, PYTHONHASHSEED="0")
+
+        log.write("$ " + " ".join(cmd) + "\n")
+        log.flush()
+        t0   = time.perf_counter()
+        proc = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=log,
+                                stderr=subprocess.STDOUT)
+        _, status, usage = os.wait4(proc.pid, 0)
+        wall = time.perf_counter() - t0
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        if proc.returncode != 0:
+            return None
+
+        movie = next((cwd / "media" / "videos").glob(f"*/*/{scene}.mp4"))
+        return {
+            "wall_s":      round(wall, 3),
+            "peak_rss_mb": round(usage.ru_maxrss / 1024, 1),   # KiB on Linux
+            "frames":      _count_frames(movie),
+            "bytes":       movie.stat().st_size,
+        }
+
+
+def measure(scene, quality, repeat):
+    """Best-of-`repeat` wall time; memory/frames/bytes from that run."""
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    best = None
+    with open(LOG_DIR / f"{scene}-q{quality}.log", "w", encoding="utf-8") as log:
+        for _ in range(repeat):
+            r = run_once(scene, quality, log)
+            if r is None:
+                return None
+            if best is None or r["wall_s"] < best["wall_s"]:
+                best = r
+    return best
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BASELINE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def machine_info():
+    return {
+        "host":   platform.node(),
+        "cpu":    platform.processor() or platform.machine(),
+        "cores":  os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def load_baseline():
+    try:
+        return json.loads(BASELINE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"machine": None, "results": {}}
+
+
+def compare(results, baseline, threshold):
+    """
+    Print a comparison table; returns the (quality, scene) pairs that
+    regressed and those with no baseline entry.
+    """
+    regressed, missing = [], []
+    print(f"\n  {'Scene':<16} {'q':<2} {'wall s':>8} {'base s':>8} {'Δ %':>7} "
+          f"{'RSS MB':>7} {'frames':>7} {'MB out':>7}")
+    print("  " + "─" * 70)
+    for q, scenes in results.items():
+        for scene, r in scenes.items():
+            if r is None:
+                print(f"  {scene:<16} {q:<2} {'FAILED':>8}")
+                regressed.append((q, scene))
+                continue
+            base = baseline["results"].get(q, {}).get(scene)
+            if base:
+                delta = 100 * (r["wall_s"] - base["wall_s"]) / base["wall_s"]
+                flag  = "  ← slower" if delta > threshold else ""
+                cmp   = f"{base['wall_s']:8.1f} {delta:+7.1f}"
+                if flag:
+                    regressed.append((q, scene))
+            else:
+                cmp, flag = f"{'—':>8} {'new':>7}", "  ← no baseline"
+                missing.append((q, scene))
+            print(f"  {scene:<16} {q:<2} {r['wall_s']:8.1f} {cmp} "
+                  f"{r['peak_rss_mb']:7.0f} {r['frames']:7d} "
+                  f"{r['bytes'] / 1e6:7.1f}{flag}")
+    return regressed, missing
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark scene renders against a baseline.")
+    p.add_argument("scenes", nargs="*", help="scenes to benchmark (default: all)")
+    p.add_argument("-q", "--quality", nargs="+", choices=BENCH_QUALITIES, default=["l"])
+    p.add_argument("--repeat", type=int, default=1, help="runs per scene; the fastest counts")
+    p.add_argument("--threshold", type=float, default=15.0,
+                   help="flag scenes more than this many percent slower (default 15)")
+    p.add_argument("--update", action="store_true",
+                   help="write the results to bench_baseline.json")
+    args = p.parse_args(argv)
+
+    deck    = discover_scenes()
+    scenes  = args.scenes or deck
+    unknown = [s for s in scenes if s not in deck]
+    if unknown:
+        print(f"unknown scene(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = {}
+    for q in args.quality:
+        for scene in scenes:
+            print(f"  bench {scene} -q{q} …", flush=True)
+            results.setdefault(q, {})[scene] = measure(scene, q, args.repeat)
+
+    baseline = load_baseline()
+    if baseline["machine"] and baseline["machine"] != machine_info():
+        print("\n  note: baseline was recorded on a different machine:",
+              baseline["machine"])
+    regressed, missing = compare(results, baseline, args.threshold)
+
+    if args.update:
+        for q, scenes_ in results.items():
+            ok = {s: r for s, r in scenes_.items() if r is not None}
+            baseline["results"].setdefault(q, {}).update(ok)
+        baseline["machine"] = machine_info()
+        BASELINE_FILE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n",
+                                 encoding="utf-8")
+        print(f"\n  baseline written to {BASELINE_FILE.name}")
+        return 0
+
+    recorded = any(baseline["results"].values())
+    if missing:
+        print(f"\n  {'' if recorded else 'warning: '}{len(missing)} scene(s) have no baseline "
+              f"to compare with; record one on the reference machine with --update and "
+              f"commit {BASELINE_FILE.name}")
+    if regressed:
+        print(f"\n  {len(regressed)} scene(s) failed or got more than "
+              f"{args.threshold:.0f}% slower")
+    return 1 if regressed or (missing and recorded) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
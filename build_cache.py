@@ -0,0 +1,300 @@
+"""
+Build Cache — Content-Addressed Incremental Deck Rebuild
+========================================================
+
+Fingerprints each Slide class so render_all.py can skip scenes that have not
+changed since their last successful render.
+
+A scene's fingerprint covers:
+  * the full source of the class (construct() and every _helper method),
+  * every module-level helper/constant it reaches, transitively, in
+    aarohan_main.py, cryptologySlide.py, utils.py and piryamid.py
+    (make_node, trapezoid, plotDotTL, palette constants, …), and in any
+    sibling module they import names from (cached_text, ChordDiagram, …)
+    or use through a plain `import` (gradient.palette, …),
+  * the bytes of every images/ asset and data file (*.json, such as
+    ecdlp_bench.json) referenced by that code,
+  * the value of every AAROHAN_* environment variable that code names
+    (AAROHAN_SCALAR, AAROHAN_FRAME_BUDGET_MS, …; cache locations excepted),
+  * the quality flag and the installed manim / manim-slides versions.
+
+Fingerprints of successful renders are stored in .build_cache.json.  A scene
+is reused only when its fingerprint matches and its slides/<Scene>.json plus
+every video segment that JSON points to are still on disk.
+
+Run:
+    python build_cache.py -q k            # show which scenes are stale
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+from importlib import metadata
+from pathlib import Path
+
+
+ROOT       = Path(__file__).resolve().parent
+DECK_FILE  = ROOT / "aarohan_main.py"
+CACHE_FILE = ROOT / ".build_cache.json"
+SLIDES_DIR = ROOT / "slides"
+
+# Star-import order in aarohan_main.py: later modules shadow earlier ones,
+# and names defined in aarohan_main.py itself shadow everything.
+HELPER_MODULES = ["cryptologySlide", "utils", "piryamid"]
+
+TOOLS = ["manim", "manim-slides"]
+
+DATA_SUFFIXES = (".json",)                      # read by scenes, e.g. ecdlp_bench.json
+ENV_VAR       = re.compile(r"AAROHAN_[A-Z0-9_]+")    # *_CACHE only moves a cache
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SOURCE INDEX
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _Module:
+    """Top-level symbols of one source file: name → (source, ast node)."""
+
+    def __init__(self, path):
+        self.path    = Path(path)
+        self.text    = self.path.read_text(encoding="utf-8")
+        self.tree    = ast.parse(self.text)
+        self.symbols = {}
+        self.imports = {}    # name → (sibling module, its name there), for `from text_cache import …`
+        self.modules = {}    # name → sibling module, for `import gradient`
+        for node in self.tree.body:
+            for name in _defined_names(node):
+                # Re-definitions (e.g. DOTCOLOR) keep the last one, like Python.
+                self.symbols[name] = (ast.get_source_segment(self.text, node), node)
+            if (isinstance(node, ast.ImportFrom) and node.module and not node.level
+                    and (self.path.parent / f"{node.module}.py").is_file()):
+                for alias in node.names:
+                    if alias.name != "*":
+                        self.imports[alias.asname or alias.name] = (node.module, alias.name)
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    if (self.path.parent / f"{alias.name}.py").is_file():
+                        self.modules[alias.asname or alias.name] = alias.name
+
+
+def _defined_names(node):
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return [node.name]
+    if isinstance(node, ast.Assign):
+        return [t.id for t in node.targets if isinstance(t, ast.Name)]
+    if isinstance(node, (ast.AnnAssign, ast.AugAssign)) and isinstance(node.target, ast.Name):
+        return [node.target.id]
+    return []
+
+
+def _used_names(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _used_attributes(node):
+    """(base, attr) for every `base.attr` with a plain name as the base."""
+    return {(n.value.id, n.attr) for n in ast.walk(node)
+            if isinstance(n, ast.Attribute) and isinstance(n.value, ast.Name)}
+
+
+def _string_constants(node):
+    return {n.value for n in ast.walk(node)
+            if isinstance(n, ast.Constant) and isinstance(n.value, str)}
+
+
+class DeckIndex:
+    """Resolves names the way `from helper import *` does in aarohan_main.py."""
+
+    def __init__(self, deck=DECK_FILE):
+        deck = Path(deck)
+        self.deck    = _Module(deck)
+        self.helpers = [_Module(deck.parent / f"{m}.py") for m in HELPER_MODULES]
+        self.others  = {}
+
+    def _module(self, name):
+        if name not in self.others:
+            self.others[name] = _Module(self.deck.path.parent / f"{name}.py")
+        return self.others[name]
+
+    def _references(self, node, home):
+        """(name, module to resolve it from) for every name `node` uses."""
+        refs = [(n, home) for n in _used_names(node)]
+        refs += [(attr, self._module(home.modules[base]))
+                 for base, attr in _used_attributes(node) if base in home.modules]
+        return refs
+
+    def _lookup(self, name, home):
+        """Find `name` as seen from module `home`; returns (module, source, node)."""
+        # Helper modules only star-import manim, so they see their own names;
+        # aarohan_main sees its own names first, then the helpers in reverse.
+        # Names imported one by one from a sibling module resolve there.
+        order = [home] if home is not self.deck else [self.deck] + self.helpers[::-1]
+        for mod in order:
+            if name in mod.symbols:
+                src, node = mod.symbols[name]
+                return mod, src, node
+            if name in mod.imports:
+                module, original = mod.imports[name]
+                return self._lookup(original, self._module(module))
+        return None
+
+    def closure(self, scene):
+        """
+        Source segments reachable from class `scene`, as a sorted list of
+        (qualified name, source) pairs, plus the set of string constants seen.
+        """
+        src, node = self.deck.symbols[scene]
+        seen      = {f"{self.deck.path.stem}.{scene}": src}
+        strings   = set(_string_constants(node))
+        todo      = self._references(node, self.deck)
+
+        while todo:
+            name, home = todo.pop()
+            hit = self._lookup(name, home)
+            if hit is None:
+                continue   # manim / numpy / builtins — covered by tool versions
+            mod, src, node = hit
+            key = f"{mod.path.stem}.{name}"
+            if key in seen:
+                continue
+            seen[key] = src
+            strings |= _string_constants(node)
+            todo += self._references(node, mod)
+
+        return sorted(seen.items()), strings
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  FINGERPRINTS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _tool_versions():
+    out = {}
+    for t in TOOLS:
+        try:
+            out[t] = metadata.version(t)
+        except metadata.PackageNotFoundError:
+            out[t] = None
+    return out
+
+
+def referenced_assets(strings, root=ROOT):
+    """images/… paths and data files among the string constants, limited to existing files."""
+    return sorted(s for s in strings
+                  if (s.startswith("images/") or s.endswith(DATA_SUFFIXES))
+                  and (root / s).is_file())
+
+
+def referenced_env(strings):
+    """AAROHAN_* variables named among the string constants, except cache locations."""
+    return sorted(s for s in strings
+                  if ENV_VAR.fullmatch(s) and not s.endswith("_CACHE"))
+
+
+def fingerprint(scene, quality, index=None, tools=None):
+    """sha256 over everything that can change the rendered output of `scene`."""
+    index = index or DeckIndex()
+    tools = tools if tools is not None else _tool_versions()
+    sources, strings = index.closure(scene)
+
+    h = hashlib.sha256()
+    h.update(f"quality={quality}\n".encode())
+    h.update(json.dumps(tools, sort_keys=True).encode())
+    for key, src in sources:
+        h.update(f"\n# {key}\n".encode())
+        h.update(src.encode())
+    for asset in referenced_assets(strings):
+        h.update(f"\n@ {asset}\n".encode())
+        h.update((ROOT / asset).read_bytes())
+    for var in referenced_env(strings):
+        h.update(f"\n$ {var}={os.environ.get(var)!r}\n".encode())
+    return h.hexdigest()
+
+
+def fingerprints(scenes, quality):
+    index = DeckIndex()
+    tools = _tool_versions()
+    return {s: fingerprint(s, quality, index, tools) for s in scenes}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CACHE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _segment_files(obj):
+    """Every "file"/"rev_file" path inside a manim-slides JSON document."""
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k in ("file", "rev_file") and isinstance(v, str):
+                yield v
+            else:
+                yield from _segment_files(v)
+    elif isinstance(obj, list):
+        for v in obj:
+            yield from _segment_files(v)
+
+
+def outputs_present(scene, slides_dir=SLIDES_DIR):
+    """True if slides/<scene>.json and all segments it references exist."""
+    path = slides_dir / f"{scene}.json"
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    files = list(_segment_files(doc))
+    return bool(files) and all((ROOT / f).is_file() for f in files)
+
+
+class BuildCache:
+    """Fingerprints of the last successful render, per quality and scene."""
+
+    def __init__(self, path=CACHE_FILE):
+        self.path = Path(path)
+        try:
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.data = {}
+
+    def is_fresh(self, scene, quality, fp):
+        return (self.data.get(quality, {}).get(scene) == fp
+                and outputs_present(scene))
+
+    def record(self, scene, quality, fp):
+        # slides/<Scene>.json is shared by all qualities, so a render at one
+        # quality invalidates whatever was recorded for the others.
+        for q in self.data:
+            self.data[q].pop(scene, None)
+        self.data.setdefault(quality, {})[scene] = fp
+
+    def forget(self, scene, quality):
+        self.data.get(quality, {}).pop(scene, None)
+
+    def save(self):
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.data, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    from render_all import QUALITIES, discover_scenes
+
+    p = argparse.ArgumentParser(description="Show which scenes need re-rendering.")
+    p.add_argument("-q", "--quality", choices=QUALITIES, default="k")
+    args = p.parse_args(argv)
+
+    cache = BuildCache()
+    for scene, fp in fingerprints(discover_scenes(), args.quality).items():
+        state = "fresh" if cache.is_fresh(scene, args.quality, fp) else "stale"
+        print(f"  {scene:<16} {state:<6} {fp[:12]}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,138 @@
+"""
+Chord Diagram — Batched k → M·k mod N Chords
+============================================
+
+The closing slide joins point k on a circle of N points to point
+round(M·k) mod N.  Building that as one Line() per chord costs a Python loop
+with two interpolate_color calls, a cos and a sin per chord, on every frame.
+
+chord_geometry() computes every endpoint, colour, opacity and stroke width of
+one (N, M, prime_strength) state with NumPy array operations.  ChordDiagram
+stores the result in one contiguous point buffer and one RGBA buffer; each
+chord is a VMobject whose points and stroke colour are views into them, so
+Cairo still strokes each chord with its own colour and width — exactly what
+the Line() version drew.
+
+set_state() rewrites those buffers in place for a new state, copying from a
+precomputed keyframes.KeyframeTable when one covers it.  Chord mobjects
+and buffers are only allocated when a state needs more chords than any
+before it, so a ValueTracker-driven diagram allocates almost nothing per frame.
+"""
+
+import numpy as np
+
+from manim import PI, VGroup, VMobject
+
+import gradient
+
+
+# Bezier control points of a straight segment, as manim's Line places them.
+_LINE_ALPHAS = np.linspace(0, 1, 4)
+
+
+def chord_frames(Ns, Ms, ps, primes, radius, max_lines, palette):
+    """
+    Chords of many states (N[i], M[i]) at one prime strength, in one batch:
+
+        start, end   (n, 3) endpoints on the circle
+        rgba         (n, 4) stroke colour and opacity
+        width        (n,)   stroke width
+        offsets      (F+1,) state i owns rows offsets[i]:offsets[i+1]
+
+    `primes` is a boolean prime mask covering 0..max(N)-1 (primes.prime_mask).
+    `palette` is (dim, bright, prime, composite), as colours or a (4, 3) array
+    from gradient.palette().  Matches the per-chord rules of LastSlide._lines:
+    gold gradient by k/N, opacity peaking half-way round, and with ps > 0.01 a
+    blend of primes toward `prime` and composites toward `composite`.  Chords with k2 == k or opacity < 0.01 are dropped.
+    """
+    dim, bright, prime_c, comp_c = gradient.palette(*palette)
+    Ns    = np.maximum(np.asarray(Ns, dtype=np.int64), 3)
+    Ms    = np.asarray(Ms, dtype=float)
+    steps = np.maximum(1, Ns // max_lines)
+    count = -(-Ns // steps)                      # len(range(0, N, step))
+
+    # k runs over range(0, N[i], step[i]) for every state i, concatenated.
+    frame = np.repeat(np.arange(len(Ns)), count)
+    first = np.repeat(np.cumsum(count) - count, count)
+    k     = (np.arange(count.sum()) - first) * steps[frame]
+    N, M  = Ns[frame], Ms[frame]
+
+    k2 = np.rint(M * k).astype(np.int64) % N
+    t  = k / N
+
+    rgb   = gradient.lerp(dim, bright, t)
+    op    = 0.12 + 0.55 * np.abs(np.sin(PI * t))
+    width = np.full(len(k), 0.7)
+
+    if ps > 0.01:
+        is_p   = primes[k]
+        target = np.where(is_p[:, None], prime_c, comp_c)
+        rgb    = gradient.lerp(rgb, target, ps)
+        op     = np.where(is_p, op + ps * (0.85 - op), op * (1.0 - ps * 0.95))
+        width  = np.where(is_p, 0.7 + ps * 0.6, 0.7 * (1.0 - ps * 0.9))
+
+    keep = (k2 != k) & (op >= 0.01)
+    k, k2, N, rgb, op, width = k[keep], k2[keep], N[keep], rgb[keep], op[keep], width[keep]
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(frame[keep], minlength=len(Ns)))])
+
+    a1 = 2 * PI * k  / N - PI / 2
+    a2 = 2 * PI * k2 / N - PI / 2
+    start = np.stack([radius * np.cos(a1), radius * np.sin(a1), np.zeros(len(k))], axis=1)
+    end   = np.stack([radius * np.cos(a2), radius * np.sin(a2), np.zeros(len(k))], axis=1)
+    rgba  = gradient.rgba(rgb, op)
+    return start, end, rgba, width, offsets
+
+
+def chord_geometry(N, M, ps, primes, radius, max_lines, palette):
+    """start, end, rgba, width of the chords of one state (see chord_frames)."""
+    return chord_frames([N], [M], ps, primes, radius, max_lines, palette)[:4]
+
+
+class ChordDiagram(VGroup):
+    """All chords of one (N, M, prime_strength) state, sharing one point buffer."""
+
+    def __init__(self, N, M, ps, primes, radius=3.0, max_lines=220, palette=None, **kwargs):
+        super().__init__(**kwargs)
+        self.primes    = primes
+        self.radius    = radius
+        self.max_lines = max_lines
+        self.palette   = palette
+        self._pool     = []          # chord VMobjects, reused across states
+        self.table     = None        # keyframes.KeyframeTable of the current segment
+        self.set_state(N, M, ps)
+
+    def _reserve(self, n):
+        """Make room for n chords; buffers and chords are only allocated to grow."""
+        if n > len(self._pool):
+            cap = max(n, 2 * len(self._pool))
+            self._pool += [VMobject() for _ in range(cap - len(self._pool))]
+            self.point_buffer = np.zeros((4 * cap, 3))
+            self.rgba_buffer  = np.zeros((cap, 4))
+        if len(self.submobjects) > n:
+            self.remove(*self.submobjects[n:])
+        elif len(self.submobjects) < n:
+            self.add(*self._pool[len(self.submobjects):n])
+
+    def set_state(self, N, M, ps, detail=None):
+        """
+        Rewrite the chord buffers in place for a new (N, M, prime_strength).
+        `detail` (detail.Detail) caps the chord count at detail.lines.
+        """
+        if detail is not None:
+            self.max_lines = detail.lines
+        hit = self.table.lookup(N, M, ps, self.max_lines) if self.table else None
+        start, end, rgba, width = hit or chord_geometry(N, M, ps, self.primes, self.radius,
+                                                        self.max_lines, self.palette)
+        n = len(start)
+        self._reserve(n)
+        np.add(start[:, None, :], _LINE_ALPHAS[None, :, None] * (end - start)[:, None, :],
+               out=self.point_buffer[:4 * n].reshape(n, 4, 3))
+        self.rgba_buffer[:n] = rgba
+
+        # Animations (FadeIn, …) rebind .points / .stroke_rgbas to new arrays,
+        # so point every chord back at its slice of the shared buffers.
+        for i, chord in enumerate(self.submobjects):
+            chord.points       = self.point_buffer[4 * i:4 * i + 4]
+            chord.stroke_rgbas = self.rgba_buffer[i:i + 1]
+            chord.stroke_width = float(width[i])
+        return self
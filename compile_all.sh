@@ -1,3 +1,3 @@
-time manim render aarohan_main.py -qk \
-    Title Introduction InsecureChannel EncDec \
-    Cryptology OneWayFunction ECDLP DoubleAndAdd ECDLP2 ECDLP3 CryptoPyramid QuantumThreat
\ No newline at end of file
+# Renders every Slide class in aarohan_main.py (LastSlide included) in parallel.
+# Extra arguments are passed through, e.g.  bash compile_all.sh -j 4 -q h
+time python render_all.py -q k "$@"
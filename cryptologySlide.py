@@ -15,6 +15,8 @@ Requires: manim >= 0.18, manim-slides
 from manim import *
 from manim_slides import Slide
 
+from text_cache import cached_text
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  PALETTE — dark background, soft pastel nodes
@@ -79,7 +81,7 @@ def make_node(lines, width, height, fill, stroke, text_color,
     texts = VGroup()
     for i, line in enumerate(lines):
         w = BOLD if (i == 0 and bold_first) else NORMAL
-        texts.add(Text(line, font_size=font_size, color=text_color, weight=w))
+        texts.add(cached_text(line, font_size=font_size, color=text_color, weight=w))
     texts.arrange(DOWN, buff=0.06)
     texts.move_to(rect)
     if texts.width  > width  - 0.22: texts.scale((width  - 0.22) / texts.width)
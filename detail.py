@@ -0,0 +1,91 @@
+"""
+Detail — Frame-Time-Bounded Level of Detail
+===========================================
+
+LastSlide.NUM_LINES fixes the chord count whatever the resolution or frame
+rate, so at -qk / 60 fps the chord figure is the most expensive thing the
+deck draws.  DetailController holds a per-frame budget in milliseconds and
+fits the detail level to it with a cost model, not a stopwatch:
+
+  * frame_ms(lines) estimates the Cairo time of one frame: CHORD_MS per
+    thousand chords at 1920 px wide, scaled by the output width (a chord's
+    stroke grows with its length in pixels);
+  * choose(label) is called before each segment.  It picks the largest level
+    whose estimate fits the budget, clamps it between the minimum density
+    and full detail, and logs what it picked.
+
+The same source, quality and budget therefore always give the same frames,
+which the loop cache (loop_cache.py) relies on.  CHORD_MS is a reference
+figure; check it against a real render with AAROHAN_PROFILE (render_profile.py).
+
+A level maps to a chord count (never below `min_lines`), the fraction of
+composite dots kept on the ring (primes always stay) and Cairo antialiasing,
+which is only switched off when even the minimum density misses the budget.
+
+With budget_ms=None every segment gets full detail.
+"""
+
+from collections import namedtuple
+
+
+CHORD_MS  = 4.0     # ms to stroke 1000 chords in a 1920-px-wide frame
+REF_WIDTH = 1920
+
+Detail = namedtuple("Detail", "level lines dot_fraction antialias")
+
+
+class DetailController:
+    """Picks a detail level per segment from the estimated frame time."""
+
+    def __init__(self, budget_ms, max_lines, min_lines, pixel_width, name="",
+                 chord_ms=CHORD_MS):
+        self.budget_ms   = budget_ms
+        self.max_lines   = max_lines
+        self.min_level   = min(1.0, min_lines / max_lines)
+        self.pixel_width = pixel_width
+        self.chord_ms    = chord_ms
+        self.name        = name
+        self.level       = 1.0
+        self.antialias   = True
+
+    def frame_ms(self, lines):
+        """Estimated Cairo time of one frame with `lines` chords."""
+        return lines / 1000 * self.chord_ms * self.pixel_width / REF_WIDTH
+
+    def detail(self):
+        return Detail(
+            level=self.level,
+            lines=max(1, round(self.max_lines * self.level)),
+            dot_fraction=self.level,
+            antialias=self.antialias,
+        )
+
+    def choose(self, label, pin=None):
+        """Detail for the next segment; `pin` (a Detail) fixes it, e.g. to close a loop."""
+        from manim import logger
+
+        ms = self.frame_ms(self.max_lines)
+        if pin is not None:
+            self.level, self.antialias = pin.level, pin.antialias
+        elif self.budget_ms is not None:
+            self.level = min(1.0, max(self.min_level, self.budget_ms / ms))
+            self.antialias = not (self.level == self.min_level
+                                  and self.frame_ms(self.max_lines * self.level) > self.budget_ms)
+
+        d = self.detail()
+        if self.budget_ms is not None:
+            logger.info(
+                f"Detail {self.name} [{label}]: {d.lines} chords, "
+                f"{100 * d.dot_fraction:.0f}% composite dots, "
+                f"antialias {'on' if d.antialias else 'off'} "
+                f"(full detail ~{ms:.1f} ms/frame, budget {self.budget_ms:g} ms)"
+            )
+        return d
+
+
+def set_antialias(camera, on):
+    """Switch Cairo antialiasing for everything the camera draws from now on."""
+    import cairo
+
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    ctx.set_antialias(cairo.ANTIALIAS_DEFAULT if on else cairo.ANTIALIAS_NONE)
@@ -0,0 +1,76 @@
+"""
+Dot Cloud — Many Filled Dots as a Handful of Paths
+==================================================
+
+A Dot() is a full VMobject: its own 8-segment bezier circle, colour arrays
+and submobject bookkeeping.  LastSlide builds hundreds of them for the ring
+of N points and for the Ulam spiral, which limits the spiral to a few hundred
+integers.
+
+DotCloud keeps the dots as NumPy arrays — positions (n, 3), radii (n,) and
+RGBA (n, 4) — and draws them with one VMobject per distinct colour/opacity.
+Each of those holds every circle of its style as subpaths of one point
+buffer, so Cairo fills a whole style in a single pass.  The circles are
+built exactly as Dot/Circle builds them, so the output looks the same.
+
+A fade touches one RGBA row per style instead of one Dot per integer, and
+tens of thousands of dots cost a few arrays rather than tens of thousands of
+mobjects.
+"""
+
+import numpy as np
+
+from manim import TAU, VGroup, VMobject
+
+
+_SEGMENTS = 8    # Circle() uses 9 anchors → 8 cubic arcs
+
+
+def _unit_circle():
+    """Bezier control points of manim's unit Circle, shape (4 · _SEGMENTS, 3)."""
+    angles   = np.linspace(0, TAU, _SEGMENTS + 1)
+    anchors  = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+    tangents = np.stack([-anchors[:, 1], anchors[:, 0], np.zeros_like(angles)], axis=1)
+    d_theta  = TAU / _SEGMENTS
+    handles1 = anchors[:-1] + (d_theta / 3) * tangents[:-1]
+    handles2 = anchors[1:]  - (d_theta / 3) * tangents[1:]
+    return np.stack([anchors[:-1], handles1, handles2, anchors[1:]], axis=1).reshape(-1, 3)
+
+
+_UNIT_CIRCLE = _unit_circle()
+
+
+def circle_points(positions, radii):
+    """Points of n circles, one closed subpath each, shape (n · 32, 3)."""
+    pts = positions[:, None, :] + radii[:, None, None] * _UNIT_CIRCLE[None, :, :]
+    return pts.reshape(-1, 3)
+
+
+class DotCloud(VGroup):
+    """Filled dots held as arrays; one VMobject per distinct RGBA."""
+
+    def __init__(self, positions, radii, rgbas, **kwargs):
+        super().__init__(**kwargs)
+        self.set_dots(positions, radii, rgbas)
+
+    def set_dots(self, positions, radii, rgbas):
+        positions = np.asarray(positions, dtype=float)
+        self.positions = positions
+        self.radii     = np.broadcast_to(np.asarray(radii, dtype=float), len(positions))
+        self.rgbas     = np.broadcast_to(np.asarray(rgbas, dtype=float), (len(positions), 4))
+
+        styles, first, which = np.unique(self.rgbas, axis=0, return_index=True,
+                                         return_inverse=True)
+        which = which.reshape(-1)
+        order = np.argsort(first)      # draw styles in order of first appearance
+
+        parts = []
+        for s in order:
+            sel  = which == s
+            part = VMobject(stroke_width=0)
+            part.points     = circle_points(self.positions[sel], self.radii[sel])
+            part.fill_rgbas = styles[s][None, :].copy()
+            parts.append(part)
+        self.remove(*self.submobjects)
+        self.add(*parts)
+        return self
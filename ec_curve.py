@@ -0,0 +1,134 @@
+"""
+EC Curve — Arc-Length-Indexed Sampling of y² = x³ + ax + b over ℝ
+=================================================================
+
+ECDLP used to draw its curve from twelve integer x values mirrored in the
+x-axis, smoothed by set_points_smoothly, and placed P, Q, R, 2P … with
+graph.point_from_proportion() at hand-tuned proportions — points that sit
+only near the true curve, each found by an arc-length search of the path.
+
+RealCurve samples any short-Weierstrass curve directly:
+
+  * the unbounded branch starts at the largest real root r of x³ + ax + b.
+    It is parametrised by u with x = r + u², y = sign(u)·√(x³ + ax + b),
+    which is smooth through the root, where dy/dx is infinite, so samples
+    that are even in u bunch up exactly where the curve turns;
+  * with three real roots the closed oval between the two smaller ones is
+    sampled the same way, by an angle around it;
+  * every branch is then refined where consecutive segments still turn by
+    more than TURN_TOL, and the cumulative arc length is tabulated once.
+
+point_from_proportion() and proportion_at_x() are binary searches in that
+table, and every point they return is evaluated on the curve itself, not
+interpolated between samples.  The unbounded branch runs from its upper end
+(proportion 0) through the root to its lower end (proportion 1), like the
+old graph.
+"""
+
+import numpy as np
+
+
+TURN_TOL = 0.02      # radians a sampled polyline may turn per vertex
+REFINE   = 8         # refinement passes
+
+
+def _turning(pts):
+    """Turning angle at every interior vertex of a polyline."""
+    d = np.diff(pts, axis=0)
+    a = np.arctan2(d[:, 1], d[:, 0])
+    return np.abs((np.diff(a) + np.pi) % (2 * np.pi) - np.pi)
+
+
+class _Branch:
+    """One connected piece of the curve, sampled by a parameter t."""
+
+    def __init__(self, param, t):
+        self.param = param
+        for _ in range(REFINE):
+            sharp = np.flatnonzero(_turning(param(t)) > TURN_TOL)
+            if not len(sharp):
+                break
+            gaps = np.union1d(sharp, sharp + 1)      # segments either side of a sharp vertex
+            new = np.sort(np.concatenate([t, (t[gaps] + t[gaps + 1]) / 2]))
+            t = new if t[0] < t[-1] else new[::-1]
+        self.t      = t
+        self.points = param(t)
+        seg         = np.linalg.norm(np.diff(self.points, axis=0), axis=1)
+        self.length = seg.sum()
+        self.arc    = np.concatenate([[0], np.cumsum(seg)]) / self.length
+
+    def at(self, alpha):
+        t = np.interp(alpha, self.arc, self.t)     # binary search in the table
+        return self.param(np.atleast_1d(t))
+
+
+class RealCurve:
+    """The real points of y² = x³ + ax + b, clipped to |y| ≤ y_max and x ≤ x_max."""
+
+    def __init__(self, a, b, x_max=np.inf, y_max=np.inf, samples=256):
+        if 4 * a ** 3 + 27 * b ** 2 == 0:
+            raise ValueError(f"y² = x³ + {a}x + {b} is singular")
+        if not (np.isfinite(x_max) or np.isfinite(y_max)):
+            raise ValueError("the unbounded branch needs a finite x_max or y_max")
+        self.a, self.b = a, b
+        roots = np.roots([1, 0, a, b])
+        self.roots = np.sort(roots[np.abs(roots.imag) < 1e-9].real)
+
+        # Upper end of the unbounded branch: x_max, or where |y| reaches y_max.
+        r    = self.roots[-1]
+        ends = [x_max]
+        if np.isfinite(y_max):
+            top = np.roots([1, 0, a, b - y_max ** 2])
+            ends.append(top[np.abs(top.imag) < 1e-9].real.max())
+        u_end = np.sqrt(max(min(ends) - r, 0))
+
+        def branch(u):
+            x = r + u * u
+            return np.stack([x, np.sign(u) * self._y(x)], axis=1)
+
+        self.main  = _Branch(branch, np.linspace(u_end, -u_end, samples))
+        self.ovals = []
+        if len(self.roots) == 3:
+            lo, hi = self.roots[0], self.roots[1]
+
+            def oval(theta):
+                x = lo + (hi - lo) * (1 - np.cos(theta)) / 2
+                return np.stack([x, np.sign(np.sin(theta)) * self._y(x)], axis=1)
+
+            self.ovals.append(_Branch(oval, np.linspace(0, 2 * np.pi, samples)))
+
+    def _y(self, x):
+        return np.sqrt(np.maximum(x ** 3 + self.a * x + self.b, 0))
+
+    # ── queries ───────────────────────────────────────────────────────────
+
+    @property
+    def points(self):
+        """Sampled (x, y) of the unbounded branch, shape (n, 2)."""
+        return self.main.points
+
+    def components(self):
+        """Sampled (x, y) of every branch: ovals first, then the unbounded one."""
+        return [o.points for o in self.ovals] + [self.main.points]
+
+    def point_from_proportion(self, alpha):
+        """(x, y) a fraction alpha of the way along the unbounded branch's length."""
+        return self.main.at(alpha)[0]
+
+    def point_at_x(self, x, upper=True):
+        """(x, y) on the curve with y ≥ 0 (upper) or y ≤ 0."""
+        if x ** 3 + self.a * x + self.b < 0:
+            raise ValueError(f"no real point of the curve has x = {x}")
+        y = self._y(float(x))
+        return np.array([x, y if upper else -y])
+
+    def proportion_at_x(self, x, upper=True):
+        """Where point_at_x(x, upper) lies along the unbounded branch, 0..1."""
+        u = np.sqrt(x - self.roots[-1]) * (1 if upper else -1)
+        return float(np.interp(-u, -self.main.t, self.main.arc))   # t runs downwards
+
+    def slope(self, point):
+        """dy/dx at a point of the curve (inf at the roots)."""
+        x, y = point
+        with np.errstate(divide="ignore"):
+            return (3 * x * x + self.a) / (2 * y)
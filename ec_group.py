@@ -0,0 +1,183 @@
+"""
+EC Group — Elliptic-Curve Group Law over ℝ and F_p
+==================================================
+
+The group law of y² = x³ + ax + b, for the ECDLP and DoubleAndAdd slides
+and for anything that needs real multiples of a point:
+
+  * over ℝ (p=None) coordinates are floats; over F_p (p prime) they are
+    integers mod p;
+  * single points are affine tuples (x, y), with None for the point at
+    infinity O.  chord(P, Q) is where the line through P and Q (the tangent
+    when P == Q) meets the curve a third time — the point a slide draws its
+    construction line to — and add(P, Q) is its mirror image, −chord(P, Q);
+  * batches are Jacobian arrays (X, Y, Z) with x = X/Z², y = Y/Z³ and Z = 0
+    for O.  jdouble() and jadd() avoid field inversions and work on whole
+    arrays, so mul_many() computes k·P for every k of an array with one
+    double-and-add pass over the bits of max(k): P, 2P, …, 64P in seven
+    rounds of array operations instead of 64 Python additions.
+
+Over F_p the arrays are int64 while p < 2³¹ (products stay below 2⁶²) and
+Python-int object arrays above that.  Over ℝ every round is renormalised to
+Z = 1, since Z grows doubly exponentially with the number of doublings.
+"""
+
+import numpy as np
+
+
+class ECGroup:
+    """Points of y² = x³ + ax + b over ℝ (p=None) or F_p."""
+
+    def __init__(self, a, b, p=None):
+        self.a, self.b, self.p = a, b, p
+        if p is not None:
+            self.a, self.b = a % p, b % p
+        if self._m(4 * a ** 3 + 27 * b ** 2) == 0:
+            raise ValueError(f"y² = x³ + {a}x + {b} is singular")
+        if p is None:
+            self.dtype = float
+        else:
+            self.dtype = np.int64 if p < 2 ** 31 else object
+
+    def __repr__(self):
+        field = "ℝ" if self.p is None else f"F_{self.p}"
+        return f"ECGroup(y² = x³ + {self.a}x + {self.b} over {field})"
+
+    # ── field ─────────────────────────────────────────────────────────────
+
+    def _m(self, v):
+        return v if self.p is None else v % self.p
+
+    def _eq(self, u, v):
+        return np.isclose(u, v, rtol=1e-9, atol=1e-12) if self.p is None else self._m(u - v) == 0
+
+    def inv(self, v):
+        """1/v in the field; element-wise for arrays."""
+        if self.p is None:
+            return 1 / v
+        if np.ndim(v) == 0:
+            return pow(int(v), -1, self.p)
+        out, base, e = np.ones_like(v), self._m(v), self.p - 2      # Fermat, v^(p−2)
+        while e:
+            if e & 1:
+                out = self._m(out * base)
+            base, e = self._m(base * base), e >> 1
+        return out
+
+    # ── affine points ─────────────────────────────────────────────────────
+
+    def is_on(self, P):
+        if P is None:
+            return True
+        x, y = P
+        return bool(self._eq(y * y, x ** 3 + self.a * x + self.b))
+
+    def neg(self, P):
+        return None if P is None else (P[0], self._m(-P[1]))
+
+    def chord(self, P, Q):
+        """Third intersection of the line PQ (tangent at P when P == Q); None is O."""
+        if P is None or Q is None:
+            return self.neg(Q if P is None else P)
+        (x1, y1), (x2, y2) = P, Q
+        if self.p is not None:
+            x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+        if self._eq(x1, x2):
+            if not self._eq(y1, y2) or self._eq(y1, 0):
+                return None                             # vertical line
+            lam = self._m((3 * x1 * x1 + self.a) * self.inv(self._m(2 * y1)))
+        else:
+            lam = self._m((y2 - y1) * self.inv(self._m(x2 - x1)))
+        x3 = self._m(lam * lam - x1 - x2)
+        return (x3, self._m(y1 + lam * (x3 - x1)))
+
+    def add(self, P, Q):
+        return self.neg(self.chord(P, Q))
+
+    def double(self, P):
+        return self.add(P, P)
+
+    def mul(self, k, P):
+        """k·P for one (arbitrarily large) integer k, left-to-right double-and-add."""
+        if k < 0:
+            k, P = -k, self.neg(P)
+        R = None
+        for bit in bin(k)[2:]:
+            R = self.double(R)
+            if bit == "1":
+                R = self.add(R, P)
+        return R
+
+    # ── Jacobian batches ──────────────────────────────────────────────────
+
+    def to_jacobian(self, points):
+        """(n, 2) affine points → (X, Y, Z) arrays with Z = 1."""
+        pts = np.asarray(points, dtype=self.dtype).reshape(-1, 2)
+        return pts[:, 0].copy(), pts[:, 1].copy(), np.ones(len(pts), dtype=self.dtype)
+
+    def to_affine(self, X, Y, Z):
+        """(X, Y, Z) → ((n, 2) affine points, mask of points at infinity)."""
+        inf = self._eq(Z, 0)
+        zi  = self.inv(np.where(inf, 1, Z))
+        zi2 = self._m(zi * zi)
+        x   = self._m(X * zi2)
+        y   = self._m(Y * self._m(zi2 * zi))
+        return np.stack([np.where(inf, 0, x), np.where(inf, 0, y)], axis=1), inf
+
+    def _normalise(self, X, Y, Z):
+        if self.p is not None:
+            return X, Y, Z
+        pts, inf = self.to_affine(X, Y, Z)
+        return pts[:, 0], pts[:, 1], np.where(inf, 0.0, 1.0)
+
+    def jdouble(self, X, Y, Z):
+        m  = self._m
+        YY = m(Y * Y)
+        S  = m(m(4 * X) * YY)
+        ZZ = m(Z * Z)
+        M  = m(m(m(3 * X) * X) + m(self.a * m(ZZ * ZZ)))
+        X3 = m(M * M - 2 * S)
+        Y3 = m(M * (S - X3) - 8 * m(YY * YY))
+        Z3 = m(m(2 * Y) * Z)
+        return X3, Y3, Z3                   # Y = 0 or Z = 0 gives Z3 = 0, i.e. O
+
+    def jadd(self, X1, Y1, Z1, X2, Y2, Z2):
+        m = self._m
+        Z1Z1, Z2Z2 = m(Z1 * Z1), m(Z2 * Z2)
+        U1, U2 = m(X1 * Z2Z2), m(X2 * Z1Z1)
+        S1, S2 = m(Y1 * m(Z2 * Z2Z2)), m(Y2 * m(Z1 * Z1Z1))
+        H, R   = m(U2 - U1), m(S2 - S1)
+        HH     = m(H * H)
+        HHH    = m(H * HH)
+        X3 = m(R * R - HHH - 2 * m(U1 * HH))
+        Y3 = m(R * (m(U1 * HH) - X3) - m(S1 * HHH))
+        Z3 = m(H * m(Z1 * Z2))
+
+        # Special cases, element-wise: either input O, P == Q, P == −Q.
+        same_x  = self._eq(U1, U2)
+        doubled = self.jdouble(X1, Y1, Z1)
+        inf1, inf2 = self._eq(Z1, 0), self._eq(Z2, 0)
+        out = []
+        for c3, cd, c1, c2 in zip((X3, Y3, Z3), doubled, (X1, Y1, Z1), (X2, Y2, Z2)):
+            c = np.where(same_x, np.where(self._eq(S1, S2), cd, 0 * c3), c3)
+            c = np.where(inf2, c1, c)
+            out.append(np.where(inf1, c2, c))
+        return tuple(out)
+
+    def mul_many(self, ks, P):
+        """k·P for every k in ks, as (len(ks), 2) affine points plus an O mask."""
+        ks = np.asarray(ks)
+        Px, Py, Pz = self.to_jacobian([P])
+        zero = np.zeros(len(ks), dtype=self.dtype)
+        X, Y, Z = zero + 1, zero + 1, zero.copy()          # all O
+        for bit in range(int(max(ks.max(), 1)).bit_length() - 1, -1, -1):
+            X, Y, Z = self.jdouble(X, Y, Z)
+            hit = ((ks >> bit) & 1) == 1
+            Xa, Ya, Za = self.jadd(X, Y, Z, Px, Py, Pz)
+            X, Y, Z = np.where(hit, Xa, X), np.where(hit, Ya, Y), np.where(hit, Za, Z)
+            X, Y, Z = self._normalise(X, Y, Z)
+        return self.to_affine(X, Y, Z)
+
+    def multiples(self, P, n):
+        """P, 2P, …, nP (see mul_many)."""
+        return self.mul_many(np.arange(1, n + 1), P)
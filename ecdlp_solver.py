@@ -0,0 +1,285 @@
+"""
+ECDLP Solver — Baby-Step Giant-Step and Parallel Pollard Rho
+============================================================
+
+Recovers m from Q = m·P on small curves, to measure how the work grows with
+the size n of P's subgroup:
+
+  * bsgs(): baby steps j·P (j ≤ ⌈√n⌉) in a dict keyed by x, so one entry
+    covers ±j·P, then giant steps Q − i·⌈√n⌉·P until one lands in it.
+    ~√n group operations and √n memory.
+  * rho(): Pollard rho with an r-adding walk X → X + M[x mod r] and
+    distinguished points (x with its low `dbits` bits zero).  Each worker
+    process runs walks from random c·P + d·Q and reports the distinguished
+    points it reaches; two walks that meet share every later point, so the
+    first distinguished point reported twice gives m.  ~√(πn/2) steps in
+    total, split across the pool, constant memory per walk.
+
+Instances use y² = x³ + 1 over F_p with p = 12·c·n − 1 prime: for
+p ≡ 2 (mod 3) that curve has exactly p + 1 points, so a point of prime
+order n is 12c times a random point.  Both attacks are generic — they only
+add points — so the curve's special shape doesn't help them.
+
+bench() times both methods as n grows from 16 bits to `max_bits` and writes
+ecdlp_bench.json for ECDLP2's measured-growth plot.  The file is checked in:
+a render only reads it, so it is deterministic and never starts a benchmark.
+
+Run:
+    python ecdlp_solver.py --max-bits 48 -j 8        # writes ecdlp_bench.json
+    python ecdlp_solver.py --max-bits 32 --bsgs-max 32 -o /tmp/quick.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from ec_group import ECGroup
+from primes import is_probable_prime
+
+
+ROOT       = Path(__file__).resolve().parent
+BENCH_FILE = ROOT / "ecdlp_bench.json"
+
+WALK_PARTS = 20          # r of the r-adding walk
+BSGS_MAX   = 40          # bits; BSGS keeps √n points in memory
+TRIALS     = 3           # instances per bit length (median time is reported)
+
+
+Instance = namedtuple("Instance", "bits p n P Q m")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  INSTANCES
+# ══════════════════════════════════════════════════════════════════════════════
+
+def instance(bits, seed=0):
+    """A random Q = m·P with P of prime order n, 2^(bits−1) < n < 2^bits."""
+    rng = random.Random(f"ecdlp-{bits}-{seed}")
+    while True:
+        n = rng.randrange(2 ** (bits - 1), 2 ** bits) | 1
+        if not is_probable_prime(n):
+            continue
+        c = next((c for c in range(1, 10_000) if is_probable_prime(12 * c * n - 1)), None)
+        if c is not None:
+            break
+    p = 12 * c * n - 1
+    E = ECGroup(0, 1, p)
+    P = None
+    while P is None:
+        x = rng.randrange(p)
+        r = (x ** 3 + 1) % p
+        y = pow(r, (p + 1) // 4, p)             # p ≡ 3 (mod 4)
+        if y * y % p == r:
+            P = E.mul(12 * c, (x, y))
+    m = rng.randrange(1, n)
+    return Instance(bits, p, n, P, E.mul(m, P), m)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  GROUP LAW  (plain ints, for the inner loops)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _add(P, Q, p):
+    """P + Q on y² = x³ + 1 mod p; None is O."""
+    if P is None:
+        return Q
+    if Q is None:
+        return P
+    x1, y1 = P
+    x2, y2 = Q
+    if x1 == x2:
+        if (y1 + y2) % p == 0:
+            return None
+        lam = 3 * x1 * x1 * pow(2 * y1, -1, p) % p
+    else:
+        lam = (y2 - y1) * pow(x2 - x1, -1, p) % p
+    x3 = (lam * lam - x1 - x2) % p
+    return x3, (lam * (x1 - x3) - y1) % p
+
+
+def _neg(P, p):
+    return None if P is None else (P[0], -P[1] % p)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BABY-STEP GIANT-STEP
+# ══════════════════════════════════════════════════════════════════════════════
+
+def bsgs(inst):
+    """(m, group operations)."""
+    p, n, P, Q = inst.p, inst.n, inst.P, inst.Q
+    E = ECGroup(0, 1, p)
+    step = math.isqrt(n) + 1
+    baby, R = {}, None
+    for j in range(1, step + 1):
+        R = _add(R, P, p)
+        baby.setdefault(R[0], (j, R[1]))
+    stride = _neg(E.mul(step, P), p)
+    G = Q
+    for i in range(step + 1):
+        if G is None:
+            return i * step % n, step + i
+        hit = baby.get(G[0])
+        if hit is not None:
+            j, y = hit
+            return (i * step + (j if y == G[1] else -j)) % n, step + i
+        G = _add(G, stride, p)
+    raise ValueError("no solution — is Q in the subgroup of P?")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PARALLEL POLLARD RHO
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _walks(p, n, P, Q, jumps, dbits, budget, seed):
+    """
+    Run walks for `budget` steps; return (distinguished points, steps).  Each
+    point is (X, c, d, steps taken in this task when it was reached).
+    """
+    rng   = random.Random(seed)
+    mask  = (1 << dbits) - 1
+    limit = 20 << dbits                   # abandon walks caught in a cycle
+    E     = ECGroup(0, 1, p)
+    found, steps = [], 0
+    while steps < budget:
+        c, d = rng.randrange(n), rng.randrange(n)
+        X = _add(E.mul(c, P), E.mul(d, Q), p)
+        for k in range(1, limit + 1):
+            if X is None:
+                break
+            if X[0] & mask == 0:
+                found.append((X, c, d, steps + k))
+                break
+            M, a, b = jumps[X[0] % WALK_PARTS]
+            X, c, d = _add(X, M, p), (c + a) % n, (d + b) % n
+        steps += k
+    return found, steps
+
+
+def _from_collision(inst, first, second):
+    """m from c1·P + d1·Q = ±(c2·P + d2·Q), or None."""
+    (X1, c1, d1, _), (X2, c2, d2, _) = first, second
+    n = inst.n
+    if X1[1] != X2[1]:                    # X1 = −X2
+        c2, d2 = -c2, -d2
+    if (d2 - d1) % n == 0:
+        return None
+    return (c1 - c2) * pow(d2 - d1, -1, n) % n
+
+
+def rho(inst, pool, jobs, seed=0):
+    """
+    (m, group operations), with walks spread over `jobs` workers of `pool`.
+    The count is the steps of every task finished before the collision plus
+    those of the colliding task up to its distinguished point.
+    """
+    p, n, P, Q = inst.p, inst.n, inst.P, inst.Q
+    E     = ECGroup(0, 1, p)
+    rng   = random.Random(f"rho-{seed}")
+    jumps = []
+    for _ in range(WALK_PARTS):
+        a, b = rng.randrange(n), rng.randrange(n)
+        jumps.append((_add(E.mul(a, P), E.mul(b, Q), p), a, b))
+    dbits  = max(0, inst.bits // 4 - 2)
+    budget = max(500, 16 << dbits)
+
+    seen, steps, task = {}, 0, 0
+    running = set()
+    try:
+        while True:
+            while len(running) < jobs:
+                task += 1
+                running.add(pool.submit(_walks, p, n, P, Q, jumps, dbits, budget,
+                                        f"{seed}-{task}"))
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                found, n_steps = fut.result()
+                for point in found:
+                    other = seen.setdefault(point[0][0], point)
+                    if other is point:
+                        continue
+                    m = _from_collision(inst, other, point)
+                    if m is not None and E.mul(m, P) == Q:
+                        return m, steps + point[3]
+                steps += n_steps
+    finally:
+        for fut in running:
+            fut.cancel()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BENCHMARK
+# ══════════════════════════════════════════════════════════════════════════════
+
+def bench(min_bits=16, max_bits=48, step=4, jobs=None, bsgs_max=BSGS_MAX, trials=TRIALS,
+          log=print):
+    """Time both attacks per bit length; returns the JSON-ready result dict."""
+    jobs    = jobs or os.cpu_count() or 1
+    results = []
+    with ProcessPoolExecutor(jobs) as pool:
+        for bits in range(min_bits, max_bits + 1, step):
+            for method in ("bsgs", "rho"):
+                if method == "bsgs" and bits > bsgs_max:
+                    continue
+                times, ops = [], []
+                for t in range(trials):
+                    inst  = instance(bits, seed=t)
+                    start = time.perf_counter()
+                    m, n_ops = bsgs(inst) if method == "bsgs" else rho(inst, pool, jobs, seed=t)
+                    times.append(time.perf_counter() - start)
+                    ops.append(n_ops)
+                    if m != inst.m:
+                        raise AssertionError(f"{method} returned {m} for m = {inst.m}")
+                row = {"bits": bits, "method": method, "seconds": statistics.median(times),
+                       "ops": statistics.median(ops), "trials": trials}
+                results.append(row)
+                log(f"  {bits:3d} bits  {method:<4}  {row['seconds']:10.4f} s  "
+                    f"{row['ops']:>14,.0f} group ops")
+    return {
+        "machine": platform.node(),
+        "cpu":     platform.processor() or platform.machine(),
+        "jobs":    jobs,
+        "python":  platform.python_version(),
+        "date":    time.strftime("%Y-%m-%d %H:%M:%S"),
+        "results": results,
+    }
+
+
+def load(path=BENCH_FILE):
+    """The saved benchmark; FileNotFoundError if it has not been run."""
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"{path} not found: run `python ecdlp_solver.py` "
+                                f"to benchmark the attacks before rendering ECDLP2")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Benchmark ECDLP attacks as the subgroup grows.")
+    p.add_argument("--min-bits", type=int, default=16)
+    p.add_argument("--max-bits", type=int, default=48)
+    p.add_argument("--step", type=int, default=4)
+    p.add_argument("--bsgs-max", type=int, default=BSGS_MAX,
+                   help=f"largest bit length to run BSGS on (default {BSGS_MAX})")
+    p.add_argument("--trials", type=int, default=TRIALS)
+    p.add_argument("-j", "--jobs", type=int, default=None, help="rho workers (default: all cores)")
+    p.add_argument("-o", "--out", default=str(BENCH_FILE))
+    args = p.parse_args(argv)
+
+    data = bench(args.min_bits, args.max_bits, args.step, args.jobs, args.bsgs_max, args.trials)
+    Path(args.out).write_text(json.dumps(data, indent=2), encoding="utf-8")
+    print(f"  wrote {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
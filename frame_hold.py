@@ -0,0 +1,150 @@
+"""
+Frame Hold — Skip Rasterising Identical Frames
+===============================================
+
+Much of the deck is still frames: self.wait(2) on the Title, the pauses after
+the OneWayFunction zooms, the stretches of LastSlide where only an updater
+re-creates the same figure.  manim only notices a still frame when a wait()
+has no updaters at all; otherwise every frame goes through Cairo again.
+
+install() wraps CairoRenderer.render so that, before each frame, a digest of
+what the camera would draw is computed: every mobject in the scene (points,
+colours, widths, image pixels, z-index, …) plus the camera's own frame and
+background colour.  While the digest doesn't change, no frame is rasterised;
+the frames are counted instead.  When the picture changes, or the animation
+ends, the held frame is handed over once as write_frame(frame, num_frames=n),
+the same call manim uses for its own frozen waits.  The video writer still
+encodes all n frames — only the Cairo work is saved.
+
+The output stays constant-frame-rate, so partial movie files, their
+concatenation and the reversed clips manim-slides builds from them are
+unchanged.  Set AAROHAN_NO_HOLD=1 to render every frame as before.
+"""
+
+import atexit
+import functools
+import hashlib
+import numbers
+import os
+
+import numpy as np
+
+
+# Camera attributes that are outputs or caches, not inputs to the picture.
+_CAMERA_SKIP = {"pixel_array", "background", "background_image",
+                "pixel_array_to_cairo_context", "frame"}
+
+stats = {"frames": 0, "held": 0}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  DIGEST
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _feed(h, obj, skip=()):
+    """Hash every array and plain value stored on `obj`, in attribute order."""
+    for key, val in vars(obj).items():
+        if key in skip:
+            continue
+        if isinstance(val, np.ndarray):
+            h.update(key.encode())
+            h.update(str(val.shape).encode())
+            h.update(np.ascontiguousarray(val).tobytes())
+        elif val is None or isinstance(val, (numbers.Number, str, bool)):
+            h.update(f"{key}={val!r};".encode())
+        elif isinstance(val, tuple) and all(isinstance(v, (numbers.Number, str)) for v in val):
+            h.update(f"{key}={val!r};".encode())
+        elif callable(getattr(val, "to_rgba", None)):       # ManimColor, e.g. background_color
+            h.update(key.encode())
+            h.update(np.asarray(val.to_rgba(), dtype=float).tobytes())
+
+
+def digest(scene, camera):
+    """Fingerprint of everything the next frame depends on."""
+    from manim.utils.family import extract_mobject_family_members
+
+    h    = hashlib.blake2b(digest_size=16)
+    mobs = extract_mobject_family_members(
+        [*scene.mobjects, *scene.foreground_mobjects], only_those_with_points=False)
+    for mob in mobs:
+        h.update(type(mob).__name__.encode())
+        _feed(h, mob, skip=("submobjects",))
+    _feed(h, camera, skip=_CAMERA_SKIP)
+    frame = getattr(camera, "frame", None)      # MovingCamera
+    if frame is not None:
+        _feed(h, frame, skip=("submobjects",))
+    return h.digest()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  HOLD
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _flush(file_writer):
+    """Write the held frame, once, with its accumulated frame count."""
+    hold = getattr(file_writer, "_aarohan_hold", None)
+    if hold is not None:
+        file_writer._aarohan_hold = None
+        file_writer.write_frame(hold["frame"], num_frames=hold["count"])
+
+
+def _wrap_render(fn):
+    @functools.wraps(fn)
+    def render(self, scene, time, moving_mobjects):
+        if self.skip_animations:
+            return fn(self, scene, time, moving_mobjects)
+
+        stats["frames"] += 1
+        state = digest(scene, self.camera)
+        hold  = getattr(self.file_writer, "_aarohan_hold", None)
+        self.time += 1 / self.camera.frame_rate
+        if hold is not None and hold["state"] == state:
+            hold["count"] += 1
+            stats["held"] += 1
+            return
+
+        _flush(self.file_writer)
+        self.update_frame(scene, moving_mobjects)
+        self.file_writer._aarohan_hold = {"state": state, "frame": self.get_frame(),
+                                          "count": 1}
+    return render
+
+
+def _wrap_flush_first(fn):
+    """Anything else that writes or closes the stream sees held frames first."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        _flush(getattr(self, "file_writer", self))
+        return fn(self, *args, **kwargs)
+    return wrapper
+
+
+def install():
+    """Patch manim's Cairo renderer unless AAROHAN_NO_HOLD is set."""
+    if os.environ.get("AAROHAN_NO_HOLD"):
+        return False
+
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if getattr(CairoRenderer.render, "_aarohan_hold", False):
+        return True
+
+    CairoRenderer.render    = _wrap_render(CairoRenderer.render)
+    CairoRenderer.add_frame = _wrap_flush_first(CairoRenderer.add_frame)
+    SceneFileWriter.end_animation = _wrap_flush_first(SceneFileWriter.end_animation)
+    SceneFileWriter.finish        = _wrap_flush_first(SceneFileWriter.finish)
+
+    CairoRenderer.render._aarohan_hold = True
+    return True
+
+
+@atexit.register
+def _report():
+    if stats["held"]:
+        from manim import logger
+
+        logger.info(
+            f"Frame hold: {stats['held']}/{stats['frames']} frames reused "
+            f"({100 * stats['held'] / stats['frames']:.0f}%) without rasterising"
+        )
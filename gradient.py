@@ -0,0 +1,50 @@
+"""
+Gradient — Batched Colour Interpolation
+=======================================
+
+interpolate_color() takes two ManimColor objects and one alpha, converts
+both, blends them and wraps the result in a new ManimColor.  Per chord or per
+dot that is a lot of object churn for three multiply-adds.
+
+Here colours are plain float arrays:
+
+  * rgb() / palette() convert hex strings, ManimColor or tuples once;
+  * lerp() blends two colours (or two arrays of colours) for a whole array of
+    t values in one call — the same linear RGB blend interpolate_color does;
+  * rgba() attaches opacities, giving (n, 4) rows that DotCloud,
+    ChordDiagram and the raster painters take as they are.
+
+Only NumPy is needed; ManimColor is accepted through its to_rgb().
+"""
+
+import numpy as np
+
+
+def rgb(color):
+    """A colour as a float RGB array in 0..1; arrays pass through."""
+    if isinstance(color, str):
+        h = color.lstrip("#")
+        return np.array([int(h[i:i + 2], 16) for i in (0, 2, 4)]) / 255
+    if hasattr(color, "to_rgb"):
+        return np.asarray(color.to_rgb(), dtype=float)
+    return np.asarray(color, dtype=float)[..., :3]
+
+
+def palette(*colors):
+    """Several colours as one (n, 3) array, converted once."""
+    return np.stack([rgb(c) for c in colors])
+
+
+def lerp(start, end, t):
+    """start + (end − start)·t for every t, shape (len(t), 3)."""
+    start, end = rgb(start), rgb(end)
+    t = np.asarray(t, dtype=float)
+    return start + (end - start) * t[..., None]
+
+
+def rgba(colors, alpha=1.0):
+    """RGB rows plus opacity (scalar or per row), shape (n, 4)."""
+    colors = np.atleast_2d(rgb(colors))
+    alpha  = np.broadcast_to(np.asarray(alpha, dtype=float), len(colors))
+    return np.concatenate([colors, alpha[:, None]], axis=1)
+
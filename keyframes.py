@@ -0,0 +1,65 @@
+"""
+Keyframes — Precomputed Chord Tables for Tracker Segments
+=========================================================
+
+Every LastSlide waypoint is a play() that moves N_t and M_t from one
+(N, M) to the next with a known rate function, run time and frame rate, so
+every (N, M) the figure will be asked for is known before the segment
+starts.
+
+KeyframeTable.for_segment() replays the animation's timing — the frame
+times manim samples, rate_func, and the tracker's linear interpolation — to
+get the (round(N), M) of each frame, then computes the chords of all of them
+in one chord_frames() batch.  The result is stored as flat float32 arrays
+plus per-frame offsets: a 9 s segment at 60 fps is a few MB.
+
+During the segment ChordDiagram.set_state() finds its state in the table
+and copies the rows into its buffers instead of recomputing them.  Any
+state that isn't in the table (a different frame rate, a skipped render)
+falls back to computing the chords directly.
+"""
+
+import numpy as np
+
+from chord_diagram import chord_frames
+
+
+class KeyframeTable:
+    """Chords of every frame of one (N, M) segment, at one prime strength."""
+
+    def __init__(self, Ns, Ms, ps, lines, start, end, rgba, width, offsets):
+        self.Ns      = np.asarray(Ns, dtype=np.int64)
+        self.Ms      = np.asarray(Ms, dtype=float)
+        self.ps      = ps
+        self.lines   = lines
+        self.start   = start.astype(np.float32)
+        self.end     = end.astype(np.float32)
+        self.rgba    = rgba.astype(np.float32)
+        self.width   = width.astype(np.float32)
+        self.offsets = offsets
+
+    @classmethod
+    def for_segment(cls, n_from, m_from, n_to, m_to, ps, run_time, fps, rate_func,
+                    primes, radius, max_lines, palette):
+        # Same sampling as Scene.play: t in arange(0, run_time, 1/fps), then
+        # the end state, which the next segment's first frame shows.
+        times  = list(np.arange(0, run_time, 1 / fps) / run_time) + [1.0]
+        alphas = np.array([rate_func(t) for t in times])
+        Ns     = np.rint((1 - alphas) * n_from + alphas * n_to).astype(np.int64)
+        Ms     = (1 - alphas) * m_from + alphas * m_to
+        geometry = chord_frames(Ns, Ms, ps, primes, radius, max_lines, palette)
+        return cls(Ns, Ms, ps, max_lines, *geometry)
+
+    @property
+    def nbytes(self):
+        return sum(a.nbytes for a in (self.start, self.end, self.rgba, self.width))
+
+    def lookup(self, N, M, ps, lines):
+        """(start, end, rgba, width) for this state, or None if not tabulated."""
+        if ps != self.ps or lines != self.lines:
+            return None
+        hit = np.flatnonzero((self.Ns == N) & (np.abs(self.Ms - M) <= 1e-9 * max(1.0, abs(M))))
+        if not len(hit):
+            return None
+        a, b = self.offsets[hit[0]], self.offsets[hit[0] + 1]
+        return self.start[a:b], self.end[a:b], self.rgba[a:b], self.width[a:b]
@@ -0,0 +1,201 @@
+"""
+Loop Cache — Reuse Rendered Loop Segments Across Deck Builds
+============================================================
+
+The LastSlide loop (~150 s of chord, prime-filter and Ulam phases) and the
+Title build-up loop only depend on their class's code and constants, yet
+they were re-rendered on every build that touched the scene at all.
+
+Wrap a loop segment's plays in segment():
+
+    self.next_slide(loop=True)
+    with loop_cache.segment(self, "loop"):
+        self.play(...)
+        ...
+    self.next_slide()
+
+The first render stores the segment's partial movie files in .loop_cache/
+under a key made of
+
+  * the scene's source fingerprint (build_cache.fingerprint: the class, every
+    helper it reaches, referenced images, manim / manim-slides versions),
+  * the class constants (WAYPOINTS_*, timings, RADIUS, NUM_LINES, ULAM_N,
+    palette, … — every UPPER_CASE attribute, as evaluated at render time),
+  * the output resolution and frame rate.
+
+Later renders with the same key run the block with animations skipped —
+each play() jumps to its end state, so the scene carries on from the right
+state — and hand the cached files to manim and manim-slides in place of the
+skipped ones, so slides/<Scene>.json and the reversed clips are built as
+usual.
+
+Before a loop is stored, its first and last frames are compared.  With
+seamless=True (the default) a loop whose restart would visibly jump is
+reported and not cached.  AAROHAN_NO_LOOP_CACHE=1 disables the cache.
+
+Run:
+    python loop_cache.py list
+    python loop_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+
+ROOT      = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("AAROHAN_LOOP_CACHE", ROOT / ".loop_cache"))
+
+SEAM_TOLERANCE = 2.0      # mean absolute difference (0–255) allowed at the seam
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  KEY
+# ══════════════════════════════════════════════════════════════════════════════
+
+def constants(cls):
+    """Every UPPER_CASE class attribute, base classes first, as text."""
+    out = {}
+    for klass in reversed(cls.__mro__):
+        for name, val in vars(klass).items():
+            if name.isupper():
+                out[name] = repr(val)
+    return out
+
+
+def loop_key(scene, name):
+    from manim import config
+
+    import build_cache
+
+    cls     = type(scene)
+    quality = f"{config.pixel_width}x{config.pixel_height}@{config.frame_rate}"
+    h = hashlib.sha256()
+    h.update(build_cache.fingerprint(cls.__name__, quality).encode())
+    h.update(name.encode())
+    h.update(json.dumps(constants(cls), sort_keys=True).encode())
+    return h.hexdigest()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SEAM CHECK
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _frame(movie, last):
+    import av
+
+    frame = None
+    with av.open(str(movie)) as container:
+        for frame in container.decode(video=0):
+            if not last:
+                break
+        return frame.to_ndarray(format="rgb24")
+
+
+def seam_error(files):
+    """Mean absolute pixel difference between the first and last frame."""
+    import numpy as np
+
+    first = _frame(files[0], last=False).astype(np.int16)
+    last  = _frame(files[-1], last=True).astype(np.int16)
+    return float(np.abs(first - last).mean())
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SEGMENT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _store(entry, files, seam):
+    tmp = entry.with_name(entry.name + f".{os.getpid()}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    names = []
+    for i, f in enumerate(files):
+        # manim-slides names slide files after the basenames of their parts,
+        # so these must be unique across cache entries.
+        name = f"{entry.name}-{i:04d}{Path(f).suffix}"
+        shutil.copy2(f, tmp / name)
+        names.append(name)
+    (tmp / "manifest.json").write_text(
+        json.dumps({"files": names, "seam": seam}, indent=2), encoding="utf-8")
+    shutil.rmtree(entry, ignore_errors=True)
+    os.replace(tmp, entry)
+
+
+@contextmanager
+def segment(scene, name, seamless=True):
+    """Render the enclosed plays once per key; afterwards splice in the cached files."""
+    from manim import logger
+
+    renderer = scene.renderer
+    writer   = renderer.file_writer
+    if (os.environ.get("AAROHAN_NO_LOOP_CACHE") or renderer._original_skipping_status
+            or not hasattr(writer, "partial_movie_files")):
+        yield
+        return
+
+    entry    = CACHE_DIR / f"{type(scene).__name__}-{name}-{loop_key(scene, name)[:16]}"
+    manifest = entry / "manifest.json"
+    start    = len(writer.partial_movie_files)
+
+    if manifest.is_file():
+        cached = json.loads(manifest.read_text(encoding="utf-8"))["files"]
+        renderer._original_skipping_status = True     # play() jumps to end states
+        try:
+            yield
+        finally:
+            renderer._original_skipping_status = renderer.skip_animations = False
+        if len(writer.partial_movie_files) - start != len(cached):
+            raise RuntimeError(
+                f"{entry.name}: cached loop has {len(cached)} animations, the scene "
+                f"played {len(writer.partial_movie_files) - start}; "
+                f"run `python loop_cache.py clear`")
+        writer.partial_movie_files[start:] = [str(entry / f) for f in cached]
+        logger.info(f"Loop cache: reused {name!r} of {type(scene).__name__} ({entry.name})")
+        return
+
+    yield
+    files = writer.partial_movie_files[start:]
+    if not files or any(f is None for f in files):
+        return                      # partially skipped (-n …): nothing to store
+    seam = seam_error(files)
+    if seam > SEAM_TOLERANCE:
+        logger.warning(f"Loop cache: {type(scene).__name__} {name!r} does not loop "
+                       f"seamlessly (first/last frame differ by {seam:.1f}/255)")
+        if seamless:
+            return
+    _store(entry, files, seam)
+    logger.info(f"Loop cache: stored {name!r} of {type(scene).__name__} ({entry.name})")
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    p   = argparse.ArgumentParser(description="Inspect or clear the loop-segment cache.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    sub.add_parser("list", help="show cached loop segments")
+    sub.add_parser("clear", help="delete every cached loop segment")
+    args = p.parse_args(argv)
+
+    if args.cmd == "clear":
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
+        print(f"  cleared {CACHE_DIR}")
+        return 0
+
+    for entry in sorted(CACHE_DIR.glob("*/manifest.json")):
+        info = json.loads(entry.read_text(encoding="utf-8"))
+        size = sum(f.stat().st_size for f in entry.parent.iterdir())
+        print(f"  {entry.parent.name:<44} {len(info['files']):3d} files "
+              f"{size / 1e6:7.1f} MB  seam {info['seam']:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
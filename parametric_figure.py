@@ -0,0 +1,59 @@
+"""
+Parametric Figure — Tracker-Driven Mobjects Updated in Place
+============================================================
+
+always_redraw(builder) throws the whole mobject away every frame: each frame
+allocates a new group of Lines / Dots / Text and the previous one is left to
+the garbage collector.  Over LastSlide's ~150 s loop that is tens of
+thousands of short-lived mobjects.
+
+ParametricFigure is a group driven by a `state()` callable (typically reading
+a few ValueTrackers).  One updater calls state() once per frame and, only
+when the value changed, hands it to every part's set_state().  Parts update
+themselves in place — ChordDiagram rewrites its buffers — or, for parts that
+are cheap but awkward to mutate (a Text label, a ring of dots), Rebuilt
+builds a new child only when its key changes.
+
+Both are plain Groups, not VGroups, so a part may also be an ImageMobject
+(LastSlide's RasterFigure above RASTER_ABOVE chords).
+"""
+
+from manim import Group
+
+
+class Rebuilt(Group):
+    """Part whose single child is rebuilt by `build(*state)` when `key(*state)` changes."""
+
+    def __init__(self, build, key=None, **kwargs):
+        super().__init__(**kwargs)
+        self.build = build
+        self.key   = key or (lambda *state: state)
+        self._key  = object()
+
+    def set_state(self, *state):
+        key = self.key(*state)
+        if key == self._key:
+            return self
+        self._key = key
+        self.remove(*self.submobjects)
+        self.add(self.build(*state))
+        return self
+
+
+class ParametricFigure(Group):
+    """Group of parts kept in sync with `state()` by one in-place updater."""
+
+    def __init__(self, state, *parts, **kwargs):
+        super().__init__(*parts, **kwargs)
+        self.state  = state
+        self._state = None
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def refresh(self):
+        state = self.state()
+        if state != self._state:
+            self._state = state
+            for part in self.submobjects:
+                part.set_state(*state)
+        return self
@@ -16,6 +16,8 @@ Everything stays inside the triangle boundary.
 from manim import *
 from manim_slides import Slide
 
+from text_cache import cached_text
+
 
 # ─────────────────────────────────────────────────────────────────
 #  COLOUR PALETTE
@@ -36,13 +38,13 @@ ETH_SILVER  = "#C0C0C0"
 #  TEXT HELPERS  (Manim font_size is in points, ~0.04 manim-units each)
 # ─────────────────────────────────────────────────────────────────
 def t_gold(s, fs=28, w=NORMAL, col=GOLD_BRIGHT):
-    return Text(s, font="GFS Complutum", font_size=fs, weight=w, color=col)
+    return cached_text(s, font="GFS Complutum", font_size=fs, weight=w, color=col)
 
 def t_white(s, fs=26, col=WHITE_T):
-    return Text(s, font="GFS Complutum", font_size=fs, color=col)
+    return cached_text(s, font="GFS Complutum", font_size=fs, color=col)
 
 def t_small(s, fs=18, col=GREY_T):
-    return Text(s, font="GFS Complutum", font_size=fs, color=col)
+    return cached_text(s, font="GFS Complutum", font_size=fs, color=col)
 
 def vstack(*items, buf=0.15):
     """Arrange Mobjects top-to-bottom."""
@@ -0,0 +1,129 @@
+"""
+Primes — Cached NumPy Sieve of Eratosthenes
+===========================================
+
+prime_mask(limit) returns a read-only boolean array `is_p` of length
+limit + 1, so primality of a whole array of integers is one indexing
+operation: `is_p[k]`.
+
+The largest mask computed so far is kept in memory and every smaller limit
+is served as a view of it.  Asking for more grows it to at least twice its
+size, so a growing spiral doesn't re-sieve on every step.  Masks of a
+million entries or more are also written to .prime_cache/ (bit-packed, one
+bit per integer), so a 50-million-integer spiral costs its sieve once per
+machine, not once per render.
+
+A sieve is for ranges.  To test one large value — a field modulus, a group
+order — is_probable_prime() runs a deterministic Miller–Rabin test instead
+of sieving every integer below it.
+
+Run:
+    python primes.py 50000000      # precompute and cache a large mask
+"""
+
+import math
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+
+ROOT      = Path(__file__).resolve().parent
+CACHE_DIR = Path(os.environ.get("AAROHAN_PRIME_CACHE", ROOT / ".prime_cache"))
+DISK_MIN  = 1_000_000       # smaller masks are cheaper to sieve than to load
+
+_mask = np.zeros(0, dtype=bool)
+
+
+def sieve(limit):
+    """Fresh boolean mask: mask[k] is True iff k is prime, for 0 ≤ k ≤ limit."""
+    mask = np.ones(limit + 1, dtype=bool)
+    mask[:2]   = False
+    mask[4::2] = False
+    for i in range(3, math.isqrt(limit) + 1, 2):
+        if mask[i]:
+            mask[i * i::2 * i] = False
+    return mask
+
+
+def _disk_path(size):
+    return CACHE_DIR / f"sieve-{size}.npy"
+
+
+def _load(limit):
+    """Smallest cached mask on disk covering `limit`, or None."""
+    sizes = []
+    for p in CACHE_DIR.glob("sieve-*.npy"):
+        try:
+            sizes.append(int(p.stem.split("-")[1]))
+        except ValueError:
+            continue
+    sizes = sorted(s for s in sizes if s > limit)
+    for size in sizes:
+        try:
+            bits = np.load(_disk_path(size))
+        except (OSError, ValueError):
+            continue
+        return np.unpackbits(bits, count=size).astype(bool)
+    return None
+
+
+def _save(mask):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    path = _disk_path(len(mask))
+    tmp  = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, np.packbits(mask))
+    os.replace(tmp, path)
+
+
+def prime_mask(limit):
+    """Read-only view mask[0..limit] of the shared, growing prime table."""
+    global _mask
+    if len(_mask) <= limit:
+        size = max(limit + 1, 2 * len(_mask))
+        mask = _load(size - 1) if size >= DISK_MIN else None
+        if mask is None:
+            mask = sieve(size - 1)
+            if size >= DISK_MIN:
+                _save(mask)
+        mask.flags.writeable = False
+        _mask = mask
+    return _mask[:limit + 1]
+
+
+def is_prime(values):
+    """Vectorized primality of an integer array (any shape)."""
+    values = np.asarray(values)
+    return prime_mask(int(values.max(initial=1)))[values]
+
+
+def is_probable_prime(n):
+    """Miller–Rabin; deterministic for n < 3.3·10²⁴ with these bases."""
+    if n < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+    for q in bases:
+        if n % q == 0:
+            return n == q
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    mask = prime_mask(n)
+    print(f"{int(mask.sum())} primes ≤ {n}  (cache: {CACHE_DIR})")
@@ -0,0 +1,125 @@
+"""
+Raster Figure — Generative Figures Drawn Straight into an RGBA Buffer
+=====================================================================
+
+A vector mobject per element stops scaling somewhere in the thousands: a
+201×201 Ulam spiral or a 20,000-chord multiplication diagram means tens of
+thousands of paths for Cairo to walk on every frame, plus the mobject
+bookkeeping around them.
+
+RasterFigure paints the whole figure once into a NumPy RGBA buffer with
+Cairo (antialiased) and shows it like an ImageMobject.  It is repainted only
+when its state changes (set_state, e.g. a new (N, M, prime_strength)) or when
+the camera zooms past the next resolution step, so holding or panning over a
+huge figure costs one image blit per frame.  FadeIn / FadeOut interpolate the
+pixel array, so they work as for any image.
+
+paint_chords() and paint_dots() take the same arrays as ChordDiagram and
+DotCloud, so a scene can switch between vector and raster per element count.
+"""
+
+import math
+
+import cairo
+import numpy as np
+
+from manim import TAU, ImageMobject, config
+
+
+ZOOM_STEP  = 1.25      # repaint when the zoom crosses a power of this
+MAX_PIXELS = 8192      # per side
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PAINTERS  (coordinates in scene units, y up)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def paint_chords(ctx, start, end, rgba, width):
+    """Stroke chords the way Camera strokes a Line (width × 0.01 scene units)."""
+    ctx.set_line_cap(cairo.LINE_CAP_BUTT)
+    for (x1, y1, _), (x2, y2, _), (r, g, b, a), w in zip(start, end, rgba, width):
+        ctx.set_source_rgba(r, g, b, a)
+        ctx.set_line_width(w * 0.01)
+        ctx.move_to(x1, y1)
+        ctx.line_to(x2, y2)
+        ctx.stroke()
+
+
+def paint_dots(ctx, positions, radii, rgbas):
+    """Fill dots, one Cairo fill per distinct colour."""
+    styles, which = np.unique(rgbas, axis=0, return_inverse=True)
+    which = which.reshape(-1)
+    for s, (r, g, b, a) in enumerate(styles):
+        ctx.set_source_rgba(r, g, b, a)
+        for (x, y, _), rad in zip(positions[which == s], radii[which == s]):
+            ctx.new_sub_path()
+            ctx.arc(x, y, rad, 0, TAU)
+        ctx.fill()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  MOBJECT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _to_rgba(bgra):
+    """Cairo's premultiplied BGRA → the straight RGBA ImageMobject expects."""
+    alpha = bgra[..., 3:4].astype(np.float32)
+    rgb   = bgra[..., 2::-1].astype(np.float32) * 255 / np.maximum(alpha, 1)
+    return np.concatenate([rgb, alpha], axis=2).clip(0, 255).astype(np.uint8)
+
+
+class RasterFigure(ImageMobject):
+    """
+    Figure of `width` × `height` scene units painted by `paint(ctx, *state)`
+    around its own centre.  Pass the MovingCamera frame as `camera_frame` to
+    keep the resolution matched to the zoom.
+    """
+
+    def __init__(self, paint, width, height, state=(), camera_frame=None,
+                 antialias=cairo.ANTIALIAS_DEFAULT, **kwargs):
+        super().__init__(np.zeros((2, 2, 4), dtype=np.uint8), **kwargs)
+        self.stretch_to_fit_width(width)
+        self.stretch_to_fit_height(height)
+        self.paint        = paint
+        self.extent       = (width, height)
+        self.camera_frame = camera_frame
+        self.antialias    = antialias
+        self.state        = tuple(state)
+        self._painted     = None
+        self.rasterise()
+        if camera_frame is not None:
+            self.add_updater(lambda m: m.rasterise())
+
+    def pixels_per_unit(self):
+        """Output resolution at the current zoom, rounded up to a ZOOM_STEP power."""
+        base = config.pixel_width / config.frame_width
+        if self.camera_frame is None:
+            return base
+        zoom = config.frame_width / self.camera_frame.width
+        return base * ZOOM_STEP ** math.ceil(math.log(zoom, ZOOM_STEP) - 1e-9)
+
+    def set_state(self, *state):
+        self.state = state
+        return self.rasterise()
+
+    def rasterise(self):
+        ppu = self.pixels_per_unit()
+        key = (self.state, ppu, self.antialias)
+        if key == self._painted:
+            return self
+        self._painted = key
+
+        w_units, h_units = self.extent
+        w = max(2, min(MAX_PIXELS, round(w_units * ppu)))
+        h = max(2, min(MAX_PIXELS, round(h_units * ppu)))
+        buf = np.zeros((h, w, 4), dtype=np.uint8)
+        surface = cairo.ImageSurface.create_for_data(buf, cairo.FORMAT_ARGB32, w, h)
+        ctx = cairo.Context(surface)
+        ctx.set_antialias(self.antialias)
+        ctx.translate(w / 2, h / 2)
+        ctx.scale(w / w_units, -h / h_units)
+        self.paint(ctx, *self.state)
+        surface.flush()
+
+        self.pixel_array = _to_rgba(buf)
+        return self
@@ -0,0 +1,258 @@
+"""
+Render All — Parallel Deck Orchestrator
+=======================================
+
+Discovers every Slide class in aarohan_main.py (in deck order) and renders
+them with one `manim render` process per scene, several scenes at a time.
+
+Run:
+    python render_all.py                  # all scenes, 4K, one job per core
+    python render_all.py -q h -j 4        # 1080p, four scenes in parallel
+    python render_all.py ECDLP LastSlide  # only the named scenes
+    python render_all.py --list           # print the discovered scenes
+
+Each scene writes its own log to logs/render/<Scene>.log.  A wall-clock
+summary is printed at the end and the exit status is non-zero if any
+scene failed.
+
+Scenes whose fingerprint (see build_cache.py) matches their last successful
+render are skipped and their slides/ JSON and segments reused; pass --force
+to render them anyway.
+
+With --warm, every literal Tex string is precompiled into the shared LaTeX
+cache (tex_cache.py) before any scene starts, so workers do not wait on
+latex/dvisvgm.
+
+With --split, scenes that declare SEGMENTS (QuantumThreat) are rendered one
+segment per process and stitched back together (see segment_render.py).
+"""
+
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import segment_render
+import tex_cache
+from build_cache import BuildCache, fingerprints
+
+
+ROOT       = Path(__file__).resolve().parent
+DECK_FILE  = ROOT / "aarohan_main.py"
+LOG_DIR    = ROOT / "logs" / "render"
+
+QUALITIES  = ["l", "m", "h", "p", "k"]   # manim -q<x> flags
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SCENE DISCOVERY
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _base_names(node):
+    """Plain names of the base classes of a ClassDef (Slide, MovingCameraScene…)."""
+    names = []
+    for b in node.bases:
+        if isinstance(b, ast.Name):
+            names.append(b.id)
+        elif isinstance(b, ast.Attribute):
+            names.append(b.attr)
+    return names
+
+
+def discover_scenes(path=DECK_FILE):
+    """
+    Return the names of all Slide subclasses defined in `path`, in source order.
+
+    The file is parsed, not imported, so discovery works without manim and
+    picks up every class the presenter will see (including LastSlide).
+    """
+    tree   = ast.parse(Path(path).read_text(encoding="utf-8"))
+    slides = {"Slide"}
+    found  = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and slides & set(_base_names(node)):
+            slides.add(node.name)
+            found.append(node.name)
+    return found
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  RENDERING
+# ══════════════════════════════════════════════════════════════════════════════
+
+def manim_command(scene, quality, deck=DECK_FILE, extra=()):
+    return [sys.executable, "-m", "manim", "render", str(deck),
+            f"-q{quality}", *extra, scene]
+
+
+def render_scene(scene, quality, deck=DECK_FILE, extra=(), env=None):
+    """
+    Render one scene in its own manim process.
+
+    Returns (scene, returncode, seconds, log_path).
+    """
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_path = LOG_DIR / f"{scene}.log"
+    cmd = manim_command(scene, quality, deck, extra)
+
+    t0 = time.perf_counter()
+    with open(log_path, "w", encoding="utf-8") as log:
+        log.write("$ " + " ".join(cmd) + "\n\n")
+        log.flush()
+        proc = subprocess.run(cmd, cwd=ROOT, stdout=log,
+                              stderr=subprocess.STDOUT, env=env)
+    return scene, proc.returncode, time.perf_counter() - t0, log_path
+
+
+def render_many(tasks, quality, jobs, extra=()):
+    """
+    Render `tasks` — (scene, deck file, env) triples — with at most `jobs`
+    manim processes alive at once.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(render_scene, s, quality, deck, extra, env)
+                   for s, deck, env in tasks]
+        for fut in as_completed(futures):
+            scene, rc, secs, log_path = fut.result()
+            results[scene] = (rc, secs, log_path)
+            status = "ok" if rc == 0 else f"FAILED ({rc})"
+            print(f"  {scene:<16} {status:<12} {secs:8.1f}s", flush=True)
+    return results
+
+
+def plan_tasks(scenes, split):
+    """
+    Expand `scenes` into render tasks.  Returns (tasks, {scene: [parts]}) where
+    the dict lists the scenes that were split into per-segment parts.
+    """
+    tasks, parts_of = [], {}
+    for s in scenes:
+        segments = segment_render.segments_of(s) if split else []
+        if len(segments) > 1:
+            module, parts = segment_render.write_parts(s, segments)
+            env = segment_render.parts_env()
+            tasks += [(p, module, env) for p in parts]
+            parts_of[s] = parts
+        else:
+            tasks.append((s, DECK_FILE, None))
+    return tasks, parts_of
+
+
+def collect_parts(results, parts_of):
+    """Replace per-part results with one stitched result per split scene."""
+    for scene, parts in parts_of.items():
+        part_results = [results.pop(p) for p in parts]
+        secs     = sum(r[1] for r in part_results)
+        failed   = [r for r in part_results if r[0] != 0]
+        log_path = LOG_DIR / f"{scene}.log"
+        if failed:
+            results[scene] = (failed[0][0], secs, failed[0][2])
+            continue
+        try:
+            movie = segment_render.stitch(scene, parts)
+            log_path.write_text(f"stitched {len(parts)} parts into {movie}\n",
+                                encoding="utf-8")
+            results[scene] = (0, secs, log_path)
+        except Exception:
+            log_path.write_text(traceback.format_exc(), encoding="utf-8")
+            results[scene] = (1, secs, log_path)
+        status = "stitched" if results[scene][0] == 0 else "FAILED (stitch)"
+        print(f"  {scene:<16} {status:<12} {secs:8.1f}s", flush=True)
+    return results
+
+
+def print_summary(scenes, results, wall, cached=()):
+    print()
+    print(f"  {'Scene':<16} {'Status':<8} {'Time':>9}")
+    print("  " + "─" * 35)
+    for s in scenes:
+        if s in cached:
+            print(f"  {s:<16} {'cached':<8} {'—':>9}")
+            continue
+        rc, secs, log_path = results[s]
+        status = "ok" if rc == 0 else "FAILED"
+        print(f"  {s:<16} {status:<8} {secs:8.1f}s")
+    print("  " + "─" * 35)
+    print(f"  {'wall clock':<25} {wall:8.1f}s")
+
+    failed = [s for s in scenes if s in results and results[s][0] != 0]
+    if failed:
+        print()
+        for s in failed:
+            print(f"  {s} failed — see {results[s][2].relative_to(ROOT)}")
+    return failed
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    p.add_argument("scenes", nargs="*",
+                   help="scenes to render (default: every Slide in the deck)")
+    p.add_argument("-q", "--quality", choices=QUALITIES, default="k",
+                   help="manim quality flag (default: k = 4K)")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                   help="number of scenes rendered in parallel")
+    p.add_argument("--warm", action="store_true",
+                   help="precompile all literal Tex strings before rendering")
+    p.add_argument("--split", action="store_true",
+                   help="render scenes that declare SEGMENTS one segment per process")
+    p.add_argument("--force", action="store_true",
+                   help="re-render scenes even if their fingerprint is unchanged")
+    p.add_argument("--list", action="store_true",
+                   help="print the discovered scenes and exit")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
+    args   = parse_args(argv)
+    deck   = discover_scenes()
+
+    if args.list:
+        print("\n".join(deck))
+        return 0
+
+    scenes  = args.scenes or deck
+    unknown = [s for s in scenes if s not in deck]
+    if unknown:
+        print(f"unknown scene(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    cache  = BuildCache()
+    fps    = fingerprints(scenes, args.quality)
+    cached = [] if args.force else [
+        s for s in scenes if cache.is_fresh(s, args.quality, fps[s])]
+    todo   = [s for s in scenes if s not in cached]
+
+    tasks, parts_of = plan_tasks(todo, args.split)
+
+    jobs = max(1, min(args.jobs, len(tasks) or 1))
+    print(f"Rendering {len(todo)} scene(s) as {len(tasks)} task(s) at "
+          f"-q{args.quality} with {jobs} job(s), {len(cached)} unchanged")
+
+    t0      = time.perf_counter()
+    if args.warm and tasks:
+        tex_cache.warm(args.jobs)
+    results = render_many(tasks, args.quality, jobs)
+    results = collect_parts(results, parts_of)
+    for s, (rc, _, _) in results.items():
+        if rc == 0:
+            cache.record(s, args.quality, fps[s])
+        else:
+            cache.forget(s, args.quality)
+    cache.save()
+
+    failed = print_summary(scenes, results, time.perf_counter() - t0, cached)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+"""
+Render Profile — Per-play() Timing with Chrome-Trace Output
+===========================================================
+
+Opt-in profiler for every Slide class in the deck.  Each Scene.play() and
+Scene.wait() call is recorded with:
+
+  * wall time and the source line in aarohan_main.py that issued it,
+  * frames rasterised and frames written to the encoder,
+  * mobjects and points handed to the camera (summed over frames),
+  * time spent in updaters (Scene.update_mobjects), in Cairo rasterisation
+    (Camera.capture_mobjects) and in frame encoding (write_frame).
+
+When a scene finishes, logs/profile/<Scene>.trace.json is written in the
+Chrome trace-event format (open it in chrome://tracing or ui.perfetto.dev)
+and a top-N table of the slowest calls is printed and saved next to it.
+
+Enable it with an environment variable — aarohan_main.py calls install(),
+which does nothing otherwise:
+
+    AAROHAN_PROFILE=1 manim render aarohan_main.py -ql LastSlide
+    AAROHAN_PROFILE=1 python render_all.py -q l Cryptology LastSlide
+
+AAROHAN_PROFILE_TOP sets the length of the summary (default 15).
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+
+ROOT        = Path(__file__).resolve().parent
+PROFILE_DIR = ROOT / "logs" / "profile"
+DECK_FILE   = str(ROOT / "aarohan_main.py")
+
+_BUCKETS = ("updaters", "raster", "encode")
+
+_scene  = None    # {"name", "t0", "events"} for the scene being rendered
+_active = None    # accumulator of the play()/wait() in progress
+
+
+def _now_us():
+    return time.perf_counter() * 1e6
+
+
+def _call_site():
+    """file:line of the innermost frame inside aarohan_main.py."""
+    f = sys._getframe(2)
+    while f is not None:
+        if f.f_code.co_filename == DECK_FILE:
+            return f"aarohan_main.py:{f.f_lineno}"
+        f = f.f_back
+    return "?"
+
+
+def _describe(args):
+    names = []
+    for a in args:
+        n = type(a).__name__
+        names.append("animate" if n == "_AnimationBuilder" else n)
+    return ", ".join(names) or "play"
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  WRAPPERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _wrap_call(fn, label):
+    """Scene.play / Scene.wait: one trace event per outermost call."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        global _active
+        if _active is not None or _scene is None:   # wait() → play(): count once
+            return fn(self, *args, **kwargs)
+
+        name = label(args, kwargs)
+        site = _call_site()
+        _active = {"frames": 0, "written": 0, "mobjects": 0, "points": 0,
+                   "_open": set(), **{b: 0.0 for b in _BUCKETS}}
+        t0 = _now_us()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            dur, acc, _active = _now_us() - t0, _active, None
+            _scene["events"].append({
+                "name": f"{name}  @{site}", "cat": "play", "ph": "X",
+                "ts": t0 - _scene["t0"], "dur": dur, "pid": 1, "tid": 1,
+                "args": {
+                    "site": site,
+                    "frames": acc["frames"],
+                    "frames_written": acc["written"],
+                    "mobjects": acc["mobjects"],
+                    "points": acc["points"],
+                    **{f"{b}_ms": round(acc[b] / 1e3, 3) for b in _BUCKETS},
+                    "other_ms": round((dur - sum(acc[b] for b in _BUCKETS)) / 1e3, 3),
+                },
+            })
+    return wrapper
+
+
+def _wrap_timed(fn, bucket, count_frame=False, counter=None):
+    """Adds the time spent in `fn` to the active call's `bucket`."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        # Skip when inactive, and when re-entered through super() so a
+        # subclass override is not counted twice.
+        if _active is None or bucket in _active["_open"]:
+            return fn(self, *args, **kwargs)
+        if count_frame:
+            from manim.utils.family import extract_mobject_family_members
+
+            mobs = extract_mobject_family_members(args[0], only_those_with_points=True)
+            _active["frames"]   += 1
+            _active["mobjects"] += len(mobs)
+            _active["points"]   += sum(len(m.points) for m in mobs)
+        if counter:
+            _active[counter] += 1
+        _active["_open"].add(bucket)
+        t0 = _now_us()
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            _active[bucket] += _now_us() - t0
+            _active["_open"].discard(bucket)
+    return wrapper
+
+
+def _wrap_render(fn):
+    """Scene.render: opens the per-scene trace and writes it when done."""
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        global _scene
+        _scene = {"name": type(self).__name__, "t0": _now_us(), "events": []}
+        try:
+            return fn(self, *args, **kwargs)
+        finally:
+            scene, _scene = _scene, None
+            write_report(scene)
+    return wrapper
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  OUTPUT
+# ══════════════════════════════════════════════════════════════════════════════
+
+def summary(scene, top):
+    events = sorted(scene["events"], key=lambda e: e["dur"], reverse=True)
+    total  = sum(e["dur"] for e in scene["events"]) / 1e6
+    lines  = [
+        f"{scene['name']}: {len(events)} calls, {total:.1f}s in play()/wait()",
+        f"  {'wall s':>7} {'frames':>6} {'points/f':>9} {'upd ms':>8} "
+        f"{'raster ms':>9} {'enc ms':>8}  call",
+    ]
+    for e in events[:top]:
+        a   = e["args"]
+        ppf = a["points"] // a["frames"] if a["frames"] else 0
+        lines.append(
+            f"  {e['dur'] / 1e6:7.2f} {a['frames']:6d} {ppf:9d} {a['updaters_ms']:8.0f} "
+            f"{a['raster_ms']:9.0f} {a['encode_ms']:8.0f}  {e['name']}"
+        )
+    return "\n".join(lines)
+
+
+def write_report(scene):
+    if not scene["events"]:
+        return
+    PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+    trace = {
+        "traceEvents": [
+            {"name": "process_name", "ph": "M", "pid": 1,
+             "args": {"name": scene["name"]}},
+            *scene["events"],
+        ],
+        "displayTimeUnit": "ms",
+    }
+    base = PROFILE_DIR / scene["name"]
+    base.with_suffix(".trace.json").write_text(json.dumps(trace), encoding="utf-8")
+
+    text = summary(scene, int(os.environ.get("AAROHAN_PROFILE_TOP", 15)))
+    base.with_suffix(".txt").write_text(text + "\n", encoding="utf-8")
+    print(text, flush=True)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  INSTALL
+# ══════════════════════════════════════════════════════════════════════════════
+
+def install(force=False):
+    """Patch manim's Scene / Camera / file writer if AAROHAN_PROFILE is set."""
+    if not (force or os.environ.get("AAROHAN_PROFILE")):
+        return False
+
+    from manim import Camera, MovingCamera, Scene
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    if getattr(Scene.play, "_aarohan_profiled", False):
+        return True
+
+    Scene.play = _wrap_call(Scene.play, lambda a, kw: _describe(a))
+    Scene.wait = _wrap_call(
+        Scene.wait, lambda a, kw: f"wait({a[0] if a else kw.get('duration', 1.0)})")
+    Scene.render = _wrap_render(Scene.render)
+    Scene.update_mobjects = _wrap_timed(Scene.update_mobjects, "updaters")
+    for cam in (Camera, MovingCamera):
+        if "capture_mobjects" in vars(cam):
+            cam.capture_mobjects = _wrap_timed(cam.capture_mobjects, "raster",
+                                               count_frame=True)
+    SceneFileWriter.write_frame = _wrap_timed(SceneFileWriter.write_frame, "encode",
+                                              counter="written")
+
+    Scene.play._aarohan_profiled = True
+    return True
@@ -0,0 +1,212 @@
+"""
+Scalar Mult — Computing m·P, Five Ways
+======================================
+
+The DoubleAndAdd slide claims m·P takes O(log₂ m) group operations.  Here the
+usual algorithms run on ec_group.ECGroup, each counting its doublings and
+additions:
+
+  * naive          P + P + … + P: m − 1 additions (only run for small m);
+  * double_and_add left to right over the bits of m: a doubling per bit and
+                   an addition per 1 bit;
+  * naf            non-adjacent form, digits in {−1, 0, 1} with no two
+                   non-zeros in a row, so about a third of them are non-zero
+                   (−P costs nothing to get);
+  * wnaf           width-w NAF: odd digits up to ±(2^(w−1) − 1), from a table
+                   of P, 3P, 5P, …; about one non-zero digit in w + 1;
+  * ladder         Montgomery ladder: one doubling and one addition per bit
+                   whatever the bit is — slower, but the sequence of
+                   operations doesn't reveal m.
+
+bit_steps(m) lists the slide's "DOUBLE / DOUBLE and ADD" step per bit of any
+m.  compare() runs every algorithm on NIST P-256 (y² = x³ − 3x + b, the same
+a = −3 as the slides' curve) and times it; the slide charts only the counts,
+which don't depend on the machine.
+
+Run:
+    python scalar_mult.py                  # a random 256-bit m
+    python scalar_mult.py 9 --repeat 50
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+
+from ec_group import ECGroup
+
+
+# NIST P-256 (FIPS 186-4, D.1.2.3): generator G of prime order N.
+P256 = ECGroup(
+    -3,
+    0x5AC635D8AA3A93E7B3EBBD55769886BC651D06B0CC53B0F63BCE3C3E27D2604B,
+    0xFFFFFFFF00000001000000000000000000000000FFFFFFFFFFFFFFFFFFFFFFFF,
+)
+G = (0x6B17D1F2E12C4247F8BCE6E563A440F277037D812DEB33A0F4A13945D898C296,
+     0x4FE342E2FE1A7F9B8EE7EB4A7C0F9E162BCE33576B315ECECBB6406837BF51F5)
+N = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+
+NAIVE_MAX = 1 << 16      # larger m would take m − 1 additions
+WNAF_W    = 4
+
+
+class Counted:
+    """ECGroup wrapper counting doublings and additions (negation is free)."""
+
+    def __init__(self, E):
+        self.E, self.doubles, self.adds = E, 0, 0
+
+    def double(self, P):
+        self.doubles += 1
+        return self.E.double(P)
+
+    def add(self, P, Q):
+        self.adds += 1
+        return self.E.add(P, Q)
+
+    def neg(self, P):
+        return self.E.neg(P)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  RECODINGS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def bit_steps(m):
+    """(bit, step) per bit of m, most significant first: 1 → DOUBLE and ADD, 0 → DOUBLE."""
+    return [(int(b), "DOUBLE and ADD" if b == "1" else "DOUBLE") for b in bin(m)[2:]]
+
+
+def naf_digits(m, w=2):
+    """Width-w NAF of m, least significant digit first (w=2 is the plain NAF)."""
+    digits = []
+    while m:
+        if m & 1:
+            d = m % (1 << w)
+            if d >= 1 << (w - 1):
+                d -= 1 << w
+            m -= d
+        else:
+            d = 0
+        digits.append(d)
+        m >>= 1
+    return digits
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  ALGORITHMS  (m ≥ 1; E is an ECGroup or a Counted)
+# ══════════════════════════════════════════════════════════════════════════════
+
+def naive(E, m, P):
+    R = P
+    for _ in range(m - 1):
+        R = E.add(R, P)
+    return R
+
+
+def double_and_add(E, m, P):
+    R = P
+    for bit in bin(m)[3:]:
+        R = E.double(R)
+        if bit == "1":
+            R = E.add(R, P)
+    return R
+
+
+def _from_digits(E, digits, table):
+    """Left to right over signed odd digits; table[d] = d·P for odd d > 0."""
+    digits = digits[::-1]
+    R = table[digits[0]]
+    for d in digits[1:]:
+        R = E.double(R)
+        if d > 0:
+            R = E.add(R, table[d])
+        elif d < 0:
+            R = E.add(R, E.neg(table[-d]))
+    return R
+
+
+def naf(E, m, P):
+    return _from_digits(E, naf_digits(m), {1: P})
+
+
+def wnaf(E, m, P, w=WNAF_W):
+    digits = naf_digits(m, w)
+    table  = {1: P}
+    if max(digits) > 1 or min(digits) < -1:
+        twice = E.double(P)
+        for d in range(3, 1 << (w - 1), 2):
+            table[d] = E.add(table[d - 2], twice)
+    return _from_digits(E, digits, table)
+
+
+def ladder(E, m, P):
+    R0, R1 = P, E.double(P)
+    for bit in bin(m)[3:]:
+        if bit == "1":
+            R0, R1 = E.add(R0, R1), E.double(R1)
+        else:
+            R0, R1 = E.double(R0), E.add(R0, R1)
+    return R0
+
+
+ALGORITHMS = {
+    "naive":          naive,
+    "double-and-add": double_and_add,
+    "NAF":            naf,
+    f"wNAF (w={WNAF_W})": wnaf,
+    "ladder":         ladder,
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  COMPARISON
+# ══════════════════════════════════════════════════════════════════════════════
+
+def compare(m, E=P256, P=G, repeat=5):
+    """
+    Doublings, additions and median seconds of every algorithm for m·P;
+    repeat=0 only counts (seconds None).  For m > NAIVE_MAX naive is not
+    run: its m − 1 additions are reported with seconds None.
+    """
+    rows, expected = [], E.mul(m, P)
+    for name, fn in ALGORITHMS.items():
+        if fn is naive and m > NAIVE_MAX:
+            rows.append({"name": name, "doubles": 0, "adds": m - 1, "seconds": None})
+            continue
+        counted = Counted(E)
+        if fn(counted, m, P) != expected:
+            raise AssertionError(f"{name} computed a wrong {m}·P")
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn(E, m, P)
+            times.append(time.perf_counter() - start)
+        rows.append({"name": name, "doubles": counted.doubles, "adds": counted.adds,
+                     "seconds": statistics.median(times) if times else None})
+    return rows
+
+
+def sample_scalar(seed=None):
+    """A random scalar 2²⁵⁵ ≤ m < N, reproducible for a given seed."""
+    return random.Random(seed).randrange(1 << 255, N)
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Compare scalar-multiplication algorithms on P-256.")
+    p.add_argument("m", nargs="?", type=int, help="scalar (default: random 256-bit)")
+    p.add_argument("--repeat", type=int, default=5)
+    args = p.parse_args(argv)
+
+    m = args.m or sample_scalar()
+    print(f"  m = {m}  ({m.bit_length()} bits)")
+    for row in compare(m, repeat=args.repeat):
+        t    = "—" if row["seconds"] is None else f"{row['seconds'] * 1e3:9.3f} ms"
+        adds = row["adds"] if row["adds"] < 10 ** 8 else f"~2^{row['adds'].bit_length()}"
+        print(f"  {row['name']:<16} {row['doubles']:>6} dbl {adds:>8} add   {t}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""
+Segment Render — Split Long Scenes Across Processes
+===================================================
+
+A Slide class opts in by listing its sub-slide methods in a SEGMENTS class
+attribute (see QuantumThreat).  Every entry must start from an empty scene
+and an untouched camera — in practice, the previous entry ends with
+_clear_slide() — so the state at each boundary is known without running the
+earlier entries.
+
+For such a scene:
+  1. write_parts() generates a module with one subclass per segment
+     (QuantumThreat__00, QuantumThreat__01, …) whose SEGMENTS holds just
+     that entry; render_all.py renders them as independent manim processes.
+  2. stitch() joins the per-part manim-slides JSON back into
+     slides/<Scene>.json.  A segment's trailing animations (its
+     _clear_slide()) and the next segment's opening animations belong to one
+     slide in a serial render, so those two videos are concatenated.  The
+     part movies are concatenated into media/videos/aarohan_main/.
+
+Video files are joined with manim-slides' own concatenation (stream copy),
+so the frames are exactly those of a serial render.
+
+Run:
+    python render_all.py --split -q k
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+
+ROOT       = Path(__file__).resolve().parent
+DECK_FILE  = ROOT / "aarohan_main.py"
+SLIDES_DIR = ROOT / "slides"
+MEDIA_DIR  = ROOT / "media"
+PARTS_DIR  = MEDIA_DIR / "segments"
+
+
+_PARTS_HEADER = '''\
+# Generated by segment_render.py — do not edit.
+import json
+from pathlib import Path
+
+from aarohan_main import {scene}
+
+TAIL_DIR = Path(__file__).with_suffix("")
+
+
+def _mark_tail(slide):
+    # manim-slides turns animations played after the last next_slide() into
+    # one more slide; stitch() must join it with the next part's first slide.
+    TAIL_DIR.mkdir(exist_ok=True)
+    open_tail = slide._current_animation > slide._start_animation
+    (TAIL_DIR / f"{{type(slide).__name__}}.json").write_text(json.dumps(open_tail))
+'''
+
+_PART_CLASS = '''
+
+class {part}({scene}):
+    SEGMENTS = [{segment!r}]
+
+    def construct(self):
+        super().construct()
+        _mark_tail(self)
+'''
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PLANNING
+# ══════════════════════════════════════════════════════════════════════════════
+
+def segments_of(scene, deck=DECK_FILE):
+    """The SEGMENTS list of class `scene`, read statically; [] if it has none."""
+    tree = ast.parse(Path(deck).read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef) and node.name == scene:
+            for stmt in node.body:
+                if (isinstance(stmt, ast.Assign)
+                        and any(isinstance(t, ast.Name) and t.id == "SEGMENTS"
+                                for t in stmt.targets)):
+                    return list(ast.literal_eval(stmt.value))
+    return []
+
+
+def parts_module(scene):
+    return PARTS_DIR / f"{scene}_parts.py"
+
+
+def write_parts(scene, segments):
+    """Generate the per-segment subclasses; returns (module path, part names)."""
+    parts = [f"{scene}__{i:02d}" for i in range(len(segments))]
+    src = _PARTS_HEADER.format(scene=scene)
+    for part, seg in zip(parts, segments):
+        src += _PART_CLASS.format(part=part, scene=scene, segment=seg)
+
+    path = parts_module(scene)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.rmtree(path.with_suffix(""), ignore_errors=True)
+    path.write_text(src, encoding="utf-8")
+    return path, parts
+
+
+def parts_env():
+    """Environment for part renders: aarohan_main must be importable."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(ROOT), env.get("PYTHONPATH")) if p)
+    return env
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  STITCHING
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _abs(path):
+    path = Path(path)
+    return path if path.is_absolute() else ROOT / path
+
+
+def _like(original, new):
+    """Write `new` in the same relative/absolute form as `original`."""
+    if Path(original).is_absolute():
+        return str(new)
+    return os.path.relpath(new, ROOT)
+
+
+def _relocate(entry, out_dir):
+    """Move an entry's videos into slides/files/<Scene>/."""
+    entry = dict(entry)
+    for key in ("file", "rev_file"):
+        src = _abs(entry[key])
+        dst = out_dir / src.name
+        shutil.move(src, dst)
+        entry[key] = _like(entry[key], dst)
+    return entry
+
+
+def _merge(a, b, out_dir):
+    """One slide playing `a` then `b`; the reversed video plays rev(b), rev(a)."""
+    from manim_slides.utils import concatenate_video_files
+
+    fwd  = [_abs(a["file"]), _abs(b["file"])]
+    name = hashlib.sha256("".join(f.name for f in fwd).encode()).hexdigest()[:32]
+    dst  = out_dir / f"{name}{fwd[0].suffix}"
+    rev  = out_dir / f"{name}_reversed{fwd[0].suffix}"
+    concatenate_video_files(fwd, dst)
+    concatenate_video_files([_abs(b["rev_file"]), _abs(a["rev_file"])], rev)
+
+    merged = dict(a)   # loop/notes/auto_next come from the next_slide() that opened it
+    merged["file"]     = _like(a["file"], dst)
+    merged["rev_file"] = _like(a["rev_file"], rev)
+    return merged
+
+
+def _tail_open(scene, part):
+    marker = parts_module(scene).with_suffix("") / f"{part}.json"
+    return json.loads(marker.read_text(encoding="utf-8"))
+
+
+def _part_movies(scene, parts):
+    """media/videos/<Scene>_parts/<quality>/<Part>.mp4, newest quality dir."""
+    base = MEDIA_DIR / "videos" / parts_module(scene).stem
+    dirs = sorted((d for d in base.iterdir() if d.is_dir()),
+                  key=lambda d: d.stat().st_mtime)
+    qdir = dirs[-1]
+    return qdir.name, [qdir / f"{p}.mp4" for p in parts]
+
+
+def stitch(scene, parts):
+    """Assemble slides/<Scene>.json and the full scene movie from the parts."""
+    from manim_slides.utils import concatenate_video_files
+
+    out_dir = SLIDES_DIR / "files" / scene
+    shutil.rmtree(out_dir, ignore_errors=True)
+    out_dir.mkdir(parents=True)
+
+    doc, slides, carry = None, [], None
+    for i, part in enumerate(parts):
+        part_json = SLIDES_DIR / f"{part}.json"
+        part_doc  = json.loads(part_json.read_text(encoding="utf-8"))
+        doc       = doc or part_doc
+        entries   = [_relocate(e, out_dir) for e in part_doc["slides"]]
+
+        if carry is not None:
+            entries = [_merge(carry, entries[0], out_dir)] + entries[1:] if entries else [carry]
+            carry = None
+        if i < len(parts) - 1 and entries and _tail_open(scene, part):
+            carry = entries.pop()
+        slides += entries
+
+        part_json.unlink()
+        shutil.rmtree(SLIDES_DIR / "files" / part, ignore_errors=True)
+
+    doc = dict(doc, slides=slides)
+    (SLIDES_DIR / f"{scene}.json").write_text(json.dumps(doc, indent=2), encoding="utf-8")
+
+    qname, movies = _part_movies(scene, parts)
+    movie = MEDIA_DIR / "videos" / DECK_FILE.stem / qname / f"{scene}.mp4"
+    movie.parent.mkdir(parents=True, exist_ok=True)
+    concatenate_video_files(movies, movie)
+    return movie
@@ -0,0 +1,174 @@
+"""
+Storyboard — One Still per Slide Segment, No Animation
+======================================================
+
+Layout work (tier positions in CryptoPyramid, table geometry in
+QuantumThreat._slide_08_pqc_table, …) only needs the state the audience sees
+when each next_slide() is reached.  This mode runs the scenes with every
+play() / wait() skipped — each animation jumps straight to its end state, as
+manim does for `-s` — and rasterises exactly one PNG per slide segment.
+
+Output:
+    storyboard/<Scene>/NN.png     one still per segment, in order
+    storyboard/index.html         contact sheet for the whole deck
+
+Run:
+    python storyboard.py                         # whole deck at -ql
+    python storyboard.py CryptoPyramid -q h      # one scene, 1080p stills
+"""
+
+import argparse
+import html
+import os
+import shutil
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from render_all import QUALITIES, discover_scenes
+
+
+ROOT    = Path(__file__).resolve().parent
+OUT_DIR = ROOT / "storyboard"
+
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CAPTURE
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _capture(scene, path):
+    """Rasterise the scene as it stands right now."""
+    renderer = scene.renderer
+    renderer.static_image = None          # never reuse a stale background
+    renderer.update_frame(scene, ignore_skipping=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    renderer.get_image().save(path)
+
+
+def storyboard_scene(name, quality):
+    """Run one scene with animations skipped; returns (name, pngs, error)."""
+    os.chdir(ROOT)                        # images/ paths are relative
+    from manim import tempconfig
+
+    import aarohan_main
+
+    out   = OUT_DIR / name
+    shutil.rmtree(out, ignore_errors=True)
+    pngs  = []
+    opts  = {
+        "quality":         QUALITY_NAMES[quality],
+        "write_to_movie":  False,
+        "save_last_frame": False,
+        "disable_caching": True,
+        "preview":         False,
+        "verbosity":       "WARNING",
+    }
+
+    with tempconfig(opts):
+        scene    = getattr(aarohan_main, name)()
+        renderer = scene.renderer
+        # Every play() jumps to its end state; nothing is interpolated.
+        renderer._original_skipping_status = True
+        renderer.save_static_frame_data = lambda *a, **k: None
+        last = {"plays": 0}
+
+        def flush():
+            if renderer.num_plays != last["plays"]:
+                path = out / f"{len(pngs):02d}.png"
+                _capture(scene, path)
+                pngs.append(path)
+                last["plays"] = renderer.num_plays
+
+        next_slide = scene.next_slide
+
+        def next_slide_with_capture(*args, **kwargs):
+            flush()
+            return next_slide(*args, **kwargs)
+
+        scene.next_slide = next_slide_with_capture
+        try:
+            scene.setup()
+            scene.construct()
+            flush()
+        except Exception:
+            return name, pngs, traceback.format_exc()
+    return name, pngs, None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CONTACT SHEET
+# ══════════════════════════════════════════════════════════════════════════════
+
+_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Aarohan 2026 — storyboard</title>
+<style>
+  body   {{ background:#000; color:#E8E8E8; font-family:sans-serif; margin:24px; }}
+  h2     {{ color:#F5D87A; font-weight:normal; border-bottom:1px solid #8A6015; }}
+  .grid  {{ display:grid; grid-template-columns:repeat(auto-fill, minmax(280px, 1fr)); gap:14px; }}
+  figure {{ margin:0; }}
+  img    {{ width:100%; border:1px solid #3A3A3A; }}
+  figcaption {{ color:#888; font-size:12px; }}
+  pre    {{ color:#E05555; white-space:pre-wrap; }}
+</style></head><body>
+{body}
+</body></html>
+"""
+
+
+def contact_sheet(results):
+    parts = []
+    for name, pngs, error in results:
+        parts.append(f"<h2>{html.escape(name)} <small>({len(pngs)} slides)</small></h2>")
+        parts.append('<div class="grid">')
+        for i, png in enumerate(pngs):
+            rel = png.relative_to(OUT_DIR).as_posix()
+            parts.append(f'<figure><a href="{rel}"><img src="{rel}" loading="lazy"></a>'
+                         f"<figcaption>{html.escape(name)} · slide {i + 1}</figcaption></figure>")
+        parts.append("</div>")
+        if error:
+            parts.append(f"<pre>{html.escape(error)}</pre>")
+    path = OUT_DIR / "index.html"
+    path.write_text(_PAGE.format(body="\n".join(parts)), encoding="utf-8")
+    return path
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CLI
+# ══════════════════════════════════════════════════════════════════════════════
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Render one still per slide segment.")
+    p.add_argument("scenes", nargs="*", help="scenes (default: every Slide in the deck)")
+    p.add_argument("-q", "--quality", choices=QUALITIES, default="l")
+    p.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    args = p.parse_args(argv)
+
+    deck    = discover_scenes()
+    scenes  = args.scenes or deck
+    unknown = [s for s in scenes if s not in deck]
+    if unknown:
+        print(f"unknown scene(s): {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    OUT_DIR.mkdir(exist_ok=True)
+    jobs = max(1, min(args.jobs, len(scenes)))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(storyboard_scene, scenes, [args.quality] * len(scenes)))
+
+    for name, pngs, error in results:
+        print(f"  {name:<16} {len(pngs):3d} stills" + ("  FAILED" if error else ""))
+    print(f"\n  contact sheet: {contact_sheet(results).relative_to(ROOT)}")
+    return 1 if any(e for _, _, e in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
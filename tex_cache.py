@@ -0,0 +1,462 @@
+"""
+TeX Cache — Shared, Lock-Safe LaTeX → SVG Cache
+===============================================
+
+Replaces manim's per-media-dir tex_to_svg_file() with a content-addressed
+cache that every render process shares.  The key is the sha256 of the full
+LaTeX document (template preamble + expression + environment) and the
+compiler settings, so identical strings — table cells, the `\\textbullet~`
+leaves of make_leaf_node, repeated labels — compile once for the whole deck.
+
+Each compile runs in a private temporary directory and the finished SVG is
+moved into place with an atomic rename, so parallel workers never read a
+half-written file or delete each other's .dvi.  A per-key file lock stops two
+workers from compiling the same string at the same time.
+
+aarohan_main.py calls install() at import time, so every Tex / MathTex goes
+through the cache.
+
+`warm` compiles in batches: all strings that share a preamble become pages
+of one document, built with a single latex and a single dvisvgm run, and
+each page is stored under the key Tex() looks up.
+
+Run:
+    python tex_cache.py warm -j 8             # precompile every literal Tex string
+    python tex_cache.py warm -j 1             # … as one document, one latex run
+    python tex_cache.py warm --scene EncDec   # only one scene's strings
+    python tex_cache.py list                  # show the strings `warm` would compile
+
+Cache location: .tex_cache/ next to this file, or $AAROHAN_TEX_CACHE.
+"""
+
+import argparse
+import ast
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:          # Windows: no lock, the atomic rename keeps it safe
+    fcntl = None
+
+
+ROOT        = Path(__file__).resolve().parent
+CACHE_DIR   = Path(os.environ.get("AAROHAN_TEX_CACHE", ROOT / ".tex_cache"))
+DECK_FILES  = ["aarohan_main.py", "cryptologySlide.py", "piryamid.py", "utils.py"]
+TEX_CLASSES = {"Tex", "MathTex", "SingleStringMathTex"}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  COMPILATION
+# ══════════════════════════════════════════════════════════════════════════════
+
+def tex_document(expression, environment, tex_template):
+    if environment is not None:
+        return tex_template.get_texcode_for_expression_in_env(expression, environment)
+    return tex_template.get_texcode_for_expression(expression)
+
+
+def cache_key(document, compiler, output_format):
+    h = hashlib.sha256()
+    h.update(f"{compiler}\n{output_format}\n".encode())
+    h.update(document.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _compile_command(compiler, output_format, tex_file, out_dir):
+    """Same invocation manim uses (manim.utils.tex_file_writing)."""
+    if compiler == "xelatex":
+        flags = ["-no-pdf"] if output_format == ".xdv" else []
+        return ["xelatex", *flags, "-interaction=batchmode", "-halt-on-error",
+                f"-output-directory={out_dir}", str(tex_file)]
+    return [compiler, "-interaction=batchmode",
+            f"-output-format={output_format[1:]}", "-halt-on-error",
+            f"-output-directory={out_dir}", str(tex_file)]
+
+
+def _svg_command(dvi_file, svg_file, output_format, page=1):
+    return ["dvisvgm", *(["--pdf"] if output_format == ".pdf" else []),
+            f"--page={page}", "--no-fonts", "--verbosity=0",
+            f"--output={svg_file}", str(dvi_file)]
+
+
+def _latex_error(log_file, document, step="LaTeX compilation", output=""):
+    """A short error message in the spirit of manim's own."""
+    lines = [l for l in output.splitlines() if l.strip()]
+    if log_file.exists():
+        lines += [l for l in log_file.read_text(errors="replace").splitlines()
+                  if l.startswith("!")]
+    detail = "\n".join(lines[:5]) or "see the .log file"
+    return ValueError(f"{step} error:\n{detail}\n\nDocument:\n{document}")
+
+
+def compile_document(document, compiler, output_format, dest):
+    """Compile `document` in a scratch directory and atomically move the SVG to `dest`."""
+    with tempfile.TemporaryDirectory(prefix="tex-", dir=dest.parent) as tmp:
+        tmp      = Path(tmp)
+        tex_file = tmp / "expr.tex"
+        tex_file.write_text(document, encoding="utf-8")
+
+        subprocess.run(_compile_command(compiler, output_format, tex_file, tmp),
+                       cwd=tmp, stdout=subprocess.DEVNULL)
+        dvi_file = tex_file.with_suffix(output_format)
+        if not dvi_file.exists():
+            raise _latex_error(tex_file.with_suffix(".log"), document)
+
+        svg_file = tmp / "expr.svg"
+        result   = subprocess.run(_svg_command(dvi_file, svg_file, output_format),
+                                  cwd=tmp, stdout=subprocess.DEVNULL,
+                                  stderr=subprocess.PIPE, text=True, errors="replace")
+        if not svg_file.exists():
+            raise _latex_error(tex_file.with_suffix(".log"), document, "dvisvgm", result.stderr)
+        os.replace(svg_file, dest)
+
+
+@contextmanager
+def _locked(path):
+    if fcntl is None:
+        yield
+        return
+    with open(path, "a") as fh:
+        fcntl.flock(fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(fh, fcntl.LOCK_UN)
+
+
+def tex_to_svg_file(expression, environment=None, tex_template=None):
+    """Drop-in replacement for manim.utils.tex_file_writing.tex_to_svg_file."""
+    from manim import config
+
+    if tex_template is None:
+        tex_template = config["tex_template"]
+    compiler = tex_template.tex_compiler
+    fmt      = tex_template.output_format
+    document = tex_document(expression, environment, tex_template)
+    svg_file = CACHE_DIR / f"{cache_key(document, compiler, fmt)}.svg"
+
+    if svg_file.exists():
+        return svg_file
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with _locked(svg_file.with_suffix(".lock")):
+        if not svg_file.exists():          # another worker may have won the race
+            compile_document(document, compiler, fmt, svg_file)
+    return svg_file
+
+
+def install():
+    """Route every Tex / MathTex through the shared cache."""
+    from manim.mobject.text import tex_mobject
+    from manim.utils import tex_file_writing
+
+    tex_mobject.tex_to_svg_file      = tex_to_svg_file
+    tex_file_writing.tex_to_svg_file = tex_to_svg_file
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  STATIC COLLECTION
+# ══════════════════════════════════════════════════════════════════════════════
+
+def _fold(node, bindings):
+    """Constant-fold a string expression; None if it is not static."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        a, b = _fold(node.left, bindings), _fold(node.right, bindings)
+        return a + b if a is not None and b is not None else None
+    if isinstance(node, ast.JoinedStr):
+        parts = [_fold(v, bindings) for v in node.values]
+        return "".join(parts) if None not in parts else None
+    if isinstance(node, ast.Name) and isinstance(bindings.get(node.id), str):
+        return bindings[node.id]
+    return None
+
+
+def _literal_strings(node, bindings):
+    """Strings of a literal list/tuple (or a name bound to one)."""
+    if isinstance(node, ast.Name):
+        node = bindings.get(node.id)
+    if isinstance(node, (ast.List, ast.Tuple)):
+        vals = [_fold(e, bindings) for e in node.elts]
+        if None not in vals:
+            return vals
+    return None
+
+
+class _Collector(ast.NodeVisitor):
+    """
+    Finds Tex(...) / MathTex(...) calls whose arguments are static strings.
+
+    Also expands `for x in [literal, …]: … Tex(x)` loops, which covers the
+    message lists and alphabet rows in the deck.
+    """
+
+    def __init__(self):
+        self.found    = set()
+        self.bindings = {}
+
+    def visit_Assign(self, node):
+        for t in node.targets:
+            if not isinstance(t, ast.Name):
+                continue
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                self.bindings[t.id] = node.value
+            elif _fold(node.value, self.bindings) is not None:
+                self.bindings[t.id] = _fold(node.value, self.bindings)
+        self.generic_visit(node)
+
+    def visit_For(self, node):
+        values = _literal_strings(node.iter, self.bindings)
+        if values is None or not isinstance(node.target, ast.Name):
+            self.generic_visit(node)
+            return
+        name  = node.target.id
+        saved = self.bindings.get(name)
+        for v in values:
+            self.bindings[name] = v
+            for stmt in node.body:
+                self.visit(stmt)
+        self.bindings[name] = saved
+
+    def visit_ListComp(self, node):
+        gen = node.generators[0] if len(node.generators) == 1 else None
+        values = None
+        if gen is not None and isinstance(gen.target, ast.Name):
+            values = _literal_strings(gen.iter, self.bindings)
+            if values is None and isinstance(gen.iter, ast.Name):
+                text   = self.bindings.get(gen.iter.id)
+                values = list(text) if isinstance(text, str) else None
+        if values is None:
+            self.generic_visit(node)
+            return
+        name  = gen.target.id
+        saved = self.bindings.get(name)
+        for v in values:
+            self.bindings[name] = v
+            self.visit(node.elt)
+        self.bindings[name] = saved
+
+    def visit_Call(self, node):
+        fn = node.func.id if isinstance(node.func, ast.Name) else None
+        if fn in TEX_CLASSES and node.args:
+            args   = [_fold(a, self.bindings) for a in node.args]
+            kwargs = {k.arg: _fold(k.value, self.bindings) for k in node.keywords
+                      if k.arg in ("tex_environment", "arg_separator")}
+            if None not in args and None not in kwargs.values():
+                self.found.add((fn, tuple(args), tuple(sorted(kwargs.items()))))
+        self.generic_visit(node)
+
+
+def collect(files=DECK_FILES, scene=None):
+    """
+    Every statically known (class, args, kwargs) Tex construction in the deck,
+    or only those inside class `scene` of aarohan_main.py.
+    """
+    if scene is not None:
+        files = files[:1]
+    found = set()
+    for name in files:
+        tree = ast.parse((ROOT / name).read_text(encoding="utf-8"))
+        c = _Collector()
+        for node in tree.body:
+            # Module-level string constants are visible everywhere.
+            if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                    and isinstance(node.targets[0], ast.Name)
+                    and isinstance(node.value, ast.Constant)
+                    and isinstance(node.value.value, str)):
+                c.bindings[node.targets[0].id] = node.value.value
+        if scene is None:
+            c.visit(tree)
+        else:
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef) and node.name == scene:
+                    c.visit(node)
+        found |= c.found
+    return sorted(found)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BATCHED COMPILATION
+#
+#  Strings that share a preamble are compiled as pages of one document:
+#  one latex run and one dvisvgm run produce every SVG, and each page is
+#  stored under the key a single-string compile would have used, so Tex()
+#  finds it without compiling anything.
+# ══════════════════════════════════════════════════════════════════════════════
+
+_PAGE_ENV     = "aarohanpage"
+_PLACEHOLDER  = '<svg xmlns="http://www.w3.org/2000/svg"><path d="M0 0h1v1h-1z"/></svg>'
+_BEGIN, _END  = "\\begin{document}", "\\end{document}"
+
+
+def record_documents(items):
+    """
+    The documents Tex() would compile for `items` and that are not cached yet,
+    as {key: (document, compiler, output_format)}.
+
+    The mobjects are built against a placeholder SVG, so this also catches the
+    extra per-substring compiles MathTex does for `{{ }}` groups.
+    """
+    import manim
+    from manim.mobject.text import tex_mobject
+
+    wanted = {}
+    placeholder = Path(tempfile.mkstemp(suffix=".svg")[1])
+    placeholder.write_text(_PLACEHOLDER)
+
+    def recorder(expression, environment=None, tex_template=None):
+        tex_template = tex_template or manim.config["tex_template"]
+        compiler = tex_template.tex_compiler
+        fmt      = tex_template.output_format
+        document = tex_document(expression, environment, tex_template)
+        key      = cache_key(document, compiler, fmt)
+        if (CACHE_DIR / f"{key}.svg").exists():
+            return CACHE_DIR / f"{key}.svg"
+        wanted[key] = (document, compiler, fmt)
+        return placeholder
+
+    saved = tex_mobject.tex_to_svg_file
+    tex_mobject.tex_to_svg_file = recorder
+    try:
+        for cls, args, kwargs in items:
+            try:
+                getattr(manim, cls)(*args, **dict(kwargs))
+            except Exception:
+                pass     # a bad string surfaces when it is compiled for real
+    finally:
+        tex_mobject.tex_to_svg_file = saved
+        placeholder.unlink()
+    return wanted
+
+
+def _split_document(document):
+    """(preamble, body) of a single-string document."""
+    head, rest = document.split(_BEGIN, 1)
+    body, _    = rest.rsplit(_END, 1)
+    return head, body
+
+
+def _multipage_preamble(head):
+    """The same preamble with one standalone page per _PAGE_ENV environment."""
+    cls = re.search(r"\\documentclass(\[([^\]]*)\])?\{standalone\}", head)
+    if cls is None:
+        return None
+    opts = ",".join(o for o in (cls.group(2), f"multi={_PAGE_ENV}") if o)
+    return (head[:cls.start()]
+            + f"\\documentclass[{opts}]{{standalone}}\n"
+            + f"\\newenvironment{{{_PAGE_ENV}}}{{}}{{}}"
+            + head[cls.end():])
+
+
+def compile_batch(entries, compiler, output_format):
+    """
+    Compile `entries` — [(key, document)] sharing one preamble — with a single
+    latex and a single dvisvgm run.  Returns False if the batch could not be
+    used (unsupported template, a failing string, page count mismatch); the
+    caller then compiles the entries one by one.
+    """
+    head = _multipage_preamble(_split_document(entries[0][1])[0])
+    if head is None:
+        return False
+    pages = "".join(f"\\begin{{{_PAGE_ENV}}}{_split_document(doc)[1]}\\end{{{_PAGE_ENV}}}\n"
+                    for _, doc in entries)
+    document = f"{head}{_BEGIN}\n{pages}{_END}\n"
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(prefix="texbatch-", dir=CACHE_DIR) as tmp:
+        tmp      = Path(tmp)
+        tex_file = tmp / "batch.tex"
+        tex_file.write_text(document, encoding="utf-8")
+        subprocess.run(_compile_command(compiler, output_format, tex_file, tmp),
+                       cwd=tmp, stdout=subprocess.DEVNULL)
+        dvi_file = tex_file.with_suffix(output_format)
+        if not dvi_file.exists():
+            return False
+
+        cmd = _svg_command(dvi_file, tmp / "page-%p.svg", output_format, page="1-")
+        subprocess.run(cmd, cwd=tmp, stdout=subprocess.DEVNULL)
+        svgs = sorted(tmp.glob("page-*.svg"), key=lambda f: int(f.stem.split("-")[1]))
+        if len(svgs) != len(entries):
+            return False
+        for (key, _), svg in zip(entries, svgs):
+            os.replace(svg, CACHE_DIR / f"{key}.svg")
+    return True
+
+
+def _compile_group(entries, compiler, fmt):
+    """Batch-compile one group, falling back to single compiles on failure."""
+    if len(entries) > 1 and compile_batch(entries, compiler, fmt):
+        return []
+    errors = []
+    for key, doc in entries:
+        try:
+            compile_document(doc, compiler, fmt, CACHE_DIR / f"{key}.svg")
+        except ValueError as e:
+            errors.append(str(e).splitlines()[1] if "\n" in str(e) else str(e))
+    return errors
+
+
+def warm(jobs, scene=None):
+    """
+    Precompile every literal Tex string of the deck (or of one scene).
+
+    Strings are grouped by preamble and each group is split into at most
+    `jobs` batches, so `-j 1` compiles the whole deck with one latex run.
+    """
+    items  = collect(scene=scene)
+    wanted = record_documents(items)
+
+    groups = {}
+    for key, (doc, compiler, fmt) in wanted.items():
+        head = _split_document(doc)[0]
+        groups.setdefault((head, compiler, fmt), []).append((key, doc))
+
+    batches = []
+    for (_, compiler, fmt), entries in groups.items():
+        n = -(-len(entries) // max(1, jobs))
+        batches += [(entries[i:i + n], compiler, fmt) for i in range(0, len(entries), n)]
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        errors = sum(pool.map(lambda b: _compile_group(*b), batches), [])
+
+    print(f"{len(items)} Tex strings, {len(wanted)} compiled in "
+          f"{len(batches)} batch(es), cache: {CACHE_DIR}")
+    for e in errors:
+        print(f"  failed: {e}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description="Shared LaTeX SVG cache for the deck.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    w = sub.add_parser("warm", help="precompile every statically known Tex string")
+    w.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                   help="parallel latex runs (1 = the whole deck in one document)")
+    w.add_argument("--scene", help="only the strings of this Slide class")
+    l = sub.add_parser("list", help="print the strings `warm` would compile")
+    l.add_argument("--scene", help="only the strings of this Slide class")
+    sub.add_parser("clear", help="delete the cache directory")
+    args = p.parse_args(argv)
+
+    if args.cmd == "warm":
+        return warm(args.jobs, args.scene)
+    if args.cmd == "list":
+        for cls, a, kw in collect(scene=args.scene):
+            print(f"{cls:<8} {' | '.join(a)}" + (f"  {dict(kw)}" if kw else ""))
+        return 0
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Text Cache — Memoizing Factory for Pango Text
+=============================================
+
+Text() runs Pango layout and parses the resulting SVG every time it is
+called.  The deck builds the same labels over and over: make_node() for the
+Cryptology tree, the t_gold / t_white / t_small pyramid helpers, and
+LastSlide._math_label, rebuilt whenever the looping label's text changes.
+
+cached_text() takes the same arguments as Text().  The first call for a given
+(string, font, font_size, weight, color, …) builds the mobject; later calls
+return a copy() of it, which only duplicates the point arrays.  The cached
+originals are never handed out, so callers may move or restyle their copy.
+
+Least-recently-used entries are evicted once MAX_ENTRIES is reached.  Hit and
+miss counters are logged when the render process exits.
+"""
+
+import atexit
+from collections import OrderedDict
+
+from manim import NORMAL, WHITE, Text, logger
+
+
+MAX_ENTRIES = 512
+
+_cache = OrderedDict()
+stats  = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def _key(text, font, font_size, weight, color, kwargs):
+    try:
+        extra = tuple(sorted(kwargs.items()))
+        hash(extra)
+    except TypeError:
+        return None          # unhashable option (e.g. a dict) — don't cache
+    return (text, font, float(font_size), str(weight), str(color), extra)
+
+
+def cached_text(text, font="", font_size=48, weight=NORMAL, color=WHITE, **kwargs):
+    """Text(...) with an LRU cache; returns a fresh copy on every call."""
+    key = _key(text, font, font_size, weight, color, kwargs)
+    if key is None:
+        return Text(text, font=font, font_size=font_size, weight=weight,
+                    color=color, **kwargs)
+
+    mob = _cache.get(key)
+    if mob is not None:
+        _cache.move_to_end(key)
+        stats["hits"] += 1
+        return mob.copy()
+
+    stats["misses"] += 1
+    mob = Text(text, font=font, font_size=font_size, weight=weight,
+               color=color, **kwargs)
+    _cache[key] = mob
+    if len(_cache) > MAX_ENTRIES:
+        _cache.popitem(last=False)
+        stats["evictions"] += 1
+    return mob.copy()
+
+
+def clear():
+    _cache.clear()
+    for k in stats:
+        stats[k] = 0
+
+
+@atexit.register
+def _report():
+    calls = stats["hits"] + stats["misses"]
+    if calls:
+        logger.info(
+            f"Text cache: {stats['hits']}/{calls} hits "
+            f"({100 * stats['hits'] / calls:.0f}%), {stats['misses']} layouts, "
+            f"{stats['evictions']} evictions"
+        )
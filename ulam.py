@@ -0,0 +1,44 @@
+"""
+Ulam — Spiral Coordinates for 1..N in Closed Form
+=================================================
+
+Walking the square spiral step by step to place integer n costs O(n), so
+placing 1..N one integer at a time costs O(N²).  Here every integer's
+(x, y) comes straight from its ring:
+
+    ring m      = ceil((√k − 1) / 2)          ring m ends at (2m+1)² = (m, −m)
+    t           = (2m+1)² − k                 steps back from the ring's end
+    bottom side   t ∈ [0,  2m)   →  (m − t,          −m)
+    left side     t ∈ [2m, 4m)   →  (−m,             −m + (t − 2m))
+    top side      t ∈ [4m, 6m)   →  (−m + (t − 4m),   m)
+    right side    t ∈ [6m, 8m)   →  (m,               m − (t − 6m))
+
+1 sits at the origin, 2 at (1, 0), and the spiral runs counter-clockwise —
+the same layout as LastSlide's original step-by-step walk.  Results are
+cached per N, so repeated scenes or tracker-driven rebuilds cost nothing.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+@lru_cache(maxsize=8)
+def ulam_coords(n):
+    """Integer (x, y) of 1..n on the Ulam spiral, shape (n, 2); read-only."""
+    k  = np.arange(1, n + 1, dtype=np.int64)
+    m  = np.ceil((np.sqrt(k) - 1) / 2).astype(np.int64)
+    # Guard against float rounding right at the perfect squares.
+    m += (2 * m + 1) ** 2 < k
+    m -= (m > 0) & ((2 * m - 1) ** 2 >= k)
+
+    t    = (2 * m + 1) ** 2 - k
+    side = np.minimum(t // np.maximum(2 * m, 1), 3)
+    u    = t - 2 * m * side
+
+    x = np.select([side == 0, side == 1, side == 2], [m - u, -m, -m + u], m)
+    y = np.select([side == 0, side == 1, side == 2], [-m, -m + u, m], m - u)
+    xy = np.stack([x, y], axis=1)
+    xy[0] = 0                       # k = 1, ring 0
+    xy.flags.writeable = False
+    return xy
@@ -1,7 +1,10 @@
 from manim import *
 from manim_slides import Slide
 
-import math
+import numpy as np
+
+from dot_cloud import DotCloud
+from fp_curve import curve_points
 
 DOTCOLOR = WHITE
 
@@ -11,22 +14,36 @@ def plotDotTL(s):
     s.play(FadeOut(dot), run_time=0.1)
 
 
-def fun(x):
-    return math.sqrt(x*x*x - 3*x + 3)
-
-
-def fun2(x):
-    return (x*x*x - 3*x + 3)
-
-
-def getEC_points():
-    points = []
-    cnt = 0
-    for i in range(9, -3, -1):
-        cnt += 1
-        points.append([i, fun(i), 0])
-
-    for i in range(cnt-1, -1, -1):
-        points.append([points[i][0], -points[i][1], 0])
-
-    return points
\ No newline at end of file
+# Curves over F_p: up to this many points are drawn as dots, beyond it as a
+# density image, opacity log-scaled by the points per pixel (a dot per point
+# would be far below a pixel anyway).
+FP_DOTS_MAX = 5000
+
+
+def fp_point_cloud(a, b, p, size=5.0, color=WHITE, opacity=0.9):
+    """
+    Every point of y² = x³ + ax + b mod p (fp_curve.py) in a size × size
+    square framed like a plot, x to the right and y up.
+    """
+    pts   = curve_points(a, b, p)
+    frame = Square(side_length=size, stroke_color=GREY_B, stroke_width=1.5)
+    xy    = (pts + 0.5) / p * size - size / 2
+    rgb   = np.asarray(ManimColor(color).to_rgb())
+
+    if len(pts) <= FP_DOTS_MAX:
+        radius = min(0.06, 0.3 * size / p)
+        cloud  = DotCloud(np.concatenate([xy, np.zeros((len(pts), 1))], axis=1),
+                          radius, [*rgb, opacity])
+        return VGroup(frame, cloud)
+
+    res    = max(2, round(size * config.pixel_width / config.frame_width))
+    counts = np.histogram2d(xy[:, 1], xy[:, 0], bins=res,
+                            range=[[-size / 2, size / 2]] * 2)[0][::-1]
+    image  = np.zeros((res, res, 4), dtype=np.uint8)
+    image[..., :3] = (rgb * 255).astype(np.uint8)
+    image[..., 3]  = (np.log1p(counts) / np.log1p(counts.max()) * opacity * 255).astype(np.uint8)
+    cloud = ImageMobject(image)
+    cloud.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+    cloud.stretch_to_fit_width(size)
+    cloud.stretch_to_fit_height(size)
+    return Group(frame, cloud)